@@ -37,7 +37,7 @@ class ICodeCreator(Protocol):
     @property
     def extension(self) -> str: ...
 
-    def generate(self, commands: Iterable[ApiCommand]) -> list[str]: ...
+    def generate(self, commands: Iterable[ApiCommand]) -> Iterable[str]: ...
 
 
 def get(**kwargs) -> ICodeCreator:
@@ -22,6 +22,10 @@ class AHKCodeFormatter(ACodeFormatter):
 
     def __init__(self, module_name: str, max_length: int) -> None:
         super().__init__(indent="  ", max_length=max_length, module_name=module_name)
+        self._name_to_code_cache: dict[str, str] = {}
+        self._name_to_doc_cache: dict[tuple[str, str | None], str] = {}
+        self._function_name_cache: dict[tuple[tuple[str, ...], bool], str] = {}
+        self._cli_name_cache: dict[str, str] = {}
 
     def comment(self, *comments: str, chars: str | None = None) -> list[str]:
         chars = chars or ";"
@@ -30,7 +34,7 @@ class AHKCodeFormatter(ACodeFormatter):
         return [f"{chars} {comment}".rstrip() for comment in comments]
 
     def region_comment(self, region: str) -> list[str]:
-        return [";;"] + self.comment(region, chars=";;;")
+        return [";;", f";;; {region}".rstrip()]
 
     def _clean_name(self, name: str) -> list[str]:
         name = self.pattern.sub(self.separator, name)
@@ -40,15 +44,26 @@ class AHKCodeFormatter(ACodeFormatter):
     def _concat_names(self, *names: str) -> str:
         return utils.as_string(*names, separator="")
 
-    def name_to_code(self, name: str) -> str:
+    def _name_to_code(self, name: str) -> str:
         names = self._clean_name(name)
         names[0] = names[0].lower()
         return self._concat_names(*names)
 
-    def name_to_doc(self, name: str, suffix: str | None = None) -> str:
+    def name_to_code(self, name: str) -> str:
+        if name not in self._name_to_code_cache:
+            self._name_to_code_cache[name] = self._name_to_code(name)
+        return self._name_to_code_cache[name]
+
+    def _name_to_doc(self, name: str, suffix: str | None = None) -> str:
         name = utils.as_string(*self._clean_name(name), separator="")
         return utils.ensure_ends_with(name, end_str=suffix)
 
+    def name_to_doc(self, name: str, suffix: str | None = None) -> str:
+        key = (name, suffix)
+        if key not in self._name_to_doc_cache:
+            self._name_to_doc_cache[key] = self._name_to_doc(name, suffix)
+        return self._name_to_doc_cache[key]
+
     def concat_args(self, *args: str, quote: bool = False) -> str:
         arg_names = utils.clean_blank(*args)
         if quote:
@@ -59,7 +74,7 @@ class AHKCodeFormatter(ACodeFormatter):
         arg_names = utils.clean_blank(*args)
         return " \" \" ".join(arg_names)
 
-    def function_name(self, *name: str, private: bool = False) -> str:
+    def _function_name(self, *name: str, private: bool = False) -> str:
         names = [self.module_name.capitalize()]
         for func_name in name:
             names += self._clean_name(func_name)
@@ -67,10 +82,21 @@ class AHKCodeFormatter(ACodeFormatter):
             names[0] = f"_{names[0]}"
         return self._concat_names(*names)
 
-    def cli_name(self, name: str) -> str:
+    def function_name(self, *name: str, private: bool = False) -> str:
+        key = (name, private)
+        if key not in self._function_name_cache:
+            self._function_name_cache[key] = self._function_name(*name, private=private)
+        return self._function_name_cache[key]
+
+    def _cli_name(self, name: str) -> str:
         names = [name.lower() for name in self._clean_name(name)]
         return utils.as_string(*names, separator="-")
 
+    def cli_name(self, name: str) -> str:
+        if name not in self._cli_name_cache:
+            self._cli_name_cache[name] = self._cli_name(name)
+        return self._cli_name_cache[name]
+
     def find_prefix_in_code(self, line: str, **kw: Unpack[FormatterArgs]) -> int:
         if " " not in line:
             return -1
@@ -87,6 +113,7 @@ class AAutohotKeyCreator(ABC, IArgCreator[TArg]):
     def __init__(self, elements: list[TArg], formatter: AHKCodeFormatter) -> None:
         self.elements = elements
         self.formatter = formatter
+        self._doc_names: list[tuple[str, str]] | None = None
 
     def to_arg(self, arg: TArg) -> str:
         return self.formatter.name_to_code(arg.name)
@@ -100,9 +127,9 @@ class AAutohotKeyCreator(ABC, IArgCreator[TArg]):
     def apply_doc_names_to(self, line: str) -> str:
         if len(self.elements) == 0:
             return line
-        for elem in self.elements:
-            search = elem.name
-            replace = self.to_doc_name(elem, suffix=None)
+        if self._doc_names is None:
+            self._doc_names = [(elem.name, self.to_doc_name(elem, suffix=None)) for elem in self.elements]
+        for search, replace in self._doc_names:
             line = line.replace(search, replace)
         return line
 
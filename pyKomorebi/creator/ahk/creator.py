@@ -28,7 +28,7 @@ class AutoHotKeyCreator(ACodeCreator):
         lines.append(creator.code(level=0, separator=" "))
         return lines
 
-    def generate(self, commands: Iterable[ApiCommand]) -> list[str]:
+    def generate(self, commands: Iterable[ApiCommand]) -> Iterable[str]:
         package_info = pkg.PackageInfo(
             name="komorebi",
             version="0.0.2",
@@ -37,10 +37,9 @@ class AutoHotKeyCreator(ACodeCreator):
             user_email="erichraschle@gmail.com",
             formatter=self.formatter,
         )
-        lines = pkg.pre_generator(package_info)
+        yield from pkg.pre_generator(package_info)
         for command in commands:
-            lines.extend(self.formatter.empty_line(count=1))
-            lines.extend(self.command(command=command))
-        # lines.extend(self.formatter.empty_line(count=2))
-        # lines.extend(pkg.post_generator(package_info))
-        return lines
+            yield from self.formatter.empty_line(count=1)
+            yield from self.command(command=command)
+        # yield from self.formatter.empty_line(count=2)
+        # yield from pkg.post_generator(package_info)
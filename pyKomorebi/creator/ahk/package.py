@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 
 from pyKomorebi.creator.ahk.code import AHKCodeFormatter
 
@@ -12,31 +13,36 @@ class PackageInfo:
     user_name: str
     user_email: str
     formatter: AHKCodeFormatter
+    _now: datetime = field(default_factory=datetime.now, init=False, repr=False)
 
     @property
     def user_and_email(self) -> str:
         return f"{self.user_name} <{self.user_email}>"
 
-    @property
+    @cached_property
     def modified(self) -> str:
-        return datetime.now().strftime("%B %d, %Y")
+        return self._now.strftime("%B %d, %Y")
 
-    @property
+    @cached_property
     def year(self) -> str:
-        return datetime.now().strftime("%Y")
+        return self._now.strftime("%Y")
 
     def indent(self, line: str, level: int = 0) -> str:
         return self.formatter.indent(line, level)
 
 
+_HEADER_TEMPLATE = (
+    "; Generated by {user_and_email} on {modified}",
+    "",
+    "#Requires AutoHotkey v2.0.2",
+    "",
+)
+
+
 def pre_generator(info: PackageInfo) -> list[str]:
-    lines = info.formatter.empty_line(count=0)
-    lines.extend([f"; Generated by {info.user_and_email} on {info.modified}"])
-    lines.extend(info.formatter.empty_line(count=1))
-    lines.extend(["#Requires AutoHotkey v2.0.2", ""])
-    return lines
+    user_and_email, modified = info.user_and_email, info.modified
+    return [line.format(user_and_email=user_and_email, modified=modified) for line in _HEADER_TEMPLATE]
 
 
 def post_generator(info: PackageInfo) -> list[str]:
-    lines = info.formatter.empty_line(count=0)
-    return lines
+    return []
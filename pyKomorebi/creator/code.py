@@ -41,6 +41,8 @@ class ICodeFormatter(Protocol):
 
     def prefix_of(self, line: str) -> int: ...
 
+    def level_indent(self, level: int) -> str: ...
+
     def indent_for(self, level: int, prefix: int = -1) -> str: ...
 
     def indent(self, line: str, level: int, prefix: int = -1) -> str: ...
@@ -61,6 +63,8 @@ class ICodeFormatter(Protocol):
 
     def valid_lines_for(self, *text: str | None, **kw: Unpack[FormatterArgs]) -> list[str]: ...
 
+    def concat_one(self, value: str, **kw: Unpack[FormatterArgs]) -> list[str]: ...
+
     def concat_values(self, *values: str, **kw: Unpack[FormatterArgs]) -> list[str]: ...
 
     def find_prefix_in_code(self, line: str, **kw: Unpack[FormatterArgs]) -> int: ...
@@ -73,6 +77,8 @@ class ACodeFormatter(ABC, ICodeFormatter):
         self.indent_str = indent
         self.max_length = max_length
         self.module_name = module_name
+        self._level_indents = [""]
+        self._column_prefixes: dict[int, str] = {}
 
     def remove_module_prefix(self, name: str) -> str:
         return name.removeprefix(self.module_name).removeprefix(self.separator)
@@ -90,15 +96,26 @@ class ACodeFormatter(ABC, ICodeFormatter):
     def prefix_of(self, line: str) -> int:
         return len(line) - len(line.lstrip())
 
+    def level_indent(self, level: int) -> str:
+        if level <= 0:
+            return ""
+        while level >= len(self._level_indents):
+            self._level_indents.append(self.indent_str * len(self._level_indents))
+        return self._level_indents[level]
+
     def indent_for(self, level: int, prefix: int = -1) -> str:
         if level <= 0 and prefix <= 0:
             return ""
-        indent = self.indent_str * level
+        indent = self.level_indent(level)
         if len(indent) > prefix:
             return indent
         return self.column_prefix(prefix)
 
     def indent(self, line: str, level: int = 0, prefix: int = -1) -> str:
+        if prefix <= 0:
+            if level <= 0:
+                return line
+            return f"{self.level_indent(level)}{line}"
         indent = self.indent_for(level, prefix)
         return f"{indent}{line}"
 
@@ -118,7 +135,9 @@ class ACodeFormatter(ABC, ICodeFormatter):
     def column_prefix(self, columns: int) -> str:
         if columns <= 0:
             return ""
-        return "".ljust(columns)
+        if columns not in self._column_prefixes:
+            self._column_prefixes[columns] = "".ljust(columns)
+        return self._column_prefixes[columns]
 
     def prepend_prefix(self, value: str, column: int) -> str:
         prefix = self.column_prefix(column)
@@ -171,22 +190,38 @@ class ACodeFormatter(ABC, ICodeFormatter):
             return False
         return len(value) != columns
 
+    def _first_line(self, value: str, **kw: Unpack[FormatterArgs]) -> str:
+        current = self.prepend_prefix(value.strip(), kw.get("prefix", 0))
+        if self._must_fill_column_in(current, kw.get("columns", 0)):
+            current = self.fill_column(current, kw.get("columns", 0))
+        return current
+
+    def concat_one(self, value: str, **kw: Unpack[FormatterArgs]) -> list[str]:
+        return [self._first_line(value, **kw)]
+
     def concat_values(self, *values: str, **kw: Unpack[FormatterArgs]) -> list[str]:
         if len(values) == 0:
             return []
+        if len(values) == 1:
+            return self.concat_one(values[0], **kw)
         concat_lines = []
-        current = self.prepend_prefix(values[0].strip(), kw.get("prefix", 0))
-        if self._must_fill_column_in(current, kw.get("columns", 0)):
-            current = self.fill_column(current, kw.get("columns", 0))
+        separator = kw["separator"]
+        # the current line is kept as parts with its length and only joined when it is complete
+        parts = [self._first_line(values[0], **kw)]
+        length = len(parts[0])
         for value in values[1:]:
             value = value.strip()
             if len(value) == 0:
                 continue
-            concat = utils.as_string(current, value, separator=kw["separator"])
-            if self.is_not_max_length(concat):
-                current = concat
+            concat_length = length + len(separator) + len(value) if length > 0 else len(value)
+            if concat_length <= self.max_length:
+                if length > 0:
+                    parts.append(separator)
+                parts.append(value)
+                length = concat_length
                 continue
-            elif not self.is_valid_line(value, **kw):
+            current = "".join(parts)
+            if not self.is_valid_line(value, **kw):
                 current, value = self._concat_to_long_value(current, value, **kw)
             if len(kw["separator"].strip()) > 0:
                 current = f"{current}{kw['separator']}".rstrip()
@@ -195,7 +230,9 @@ class ACodeFormatter(ABC, ICodeFormatter):
             if kw.get("columns", 0) > 0:
                 prefix = max(kw.get("prefix", 0), kw.get("columns", 0) + 1)
             current = self.prepend_prefix(value, prefix)
-        concat_lines.append(current)
+            parts = [current]
+            length = len(current)
+        concat_lines.append("".join(parts))
         return concat_lines
 
 
@@ -56,10 +56,10 @@ class ADocCreator(ABC, IDocCreator):
         doc_lines = self._add_constants_title(arg_doc, doc_lines, **kw)
         kw["prefix"] = kw.get("columns", 0) + 1  # +1 for the space
         if arg_doc.has_constants_descriptions():
-            enum_column = max([len(arg_doc.get_name(const)) for const in arg_doc.constants])
+            names = [arg_doc.get_name(const) for const in arg_doc.constants]
+            enum_column = max([len(name) for name in names])
             kw["columns"] = enum_column + kw.get("columns", 0) + 1  # +1 for the space
-            for constant in arg_doc.constants:
-                name = arg_doc.get_name(constant)
+            for name, constant in zip(names, arg_doc.constants):
                 if constant.has_description():
                     values = self.formatter.concat_values(name, *constant.description, **kw)
                 else:
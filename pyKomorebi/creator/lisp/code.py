@@ -1,5 +1,7 @@
 import re
+import sys
 from abc import abstractmethod
+from functools import lru_cache
 from typing import Callable, Iterable, TypeGuard, Unpack
 
 from pyKomorebi import utils
@@ -24,28 +26,39 @@ from pyKomorebi.model import (
 )
 
 
+NAME_PATTERN = re.compile(r'[^a-zA-Z0-9"]+')
+
+
+@lru_cache(maxsize=2048)
+def _clean_name(name: str, separator: str) -> str:
+    # the same argument and option names repeat across the commands
+    if name.isascii() and name.isalnum():
+        return sys.intern(name)
+    if separator == "-" and name.isascii() and name.replace("-", "").isalnum():
+        # dashed names only need their dash runs collapsed
+        return sys.intern("-".join([part for part in name.split("-") if len(part) > 0]))
+    name = NAME_PATTERN.sub(separator, name)
+    return sys.intern(name.removeprefix(separator).removesuffix(separator))
+
+
 class LispCodeFormatter(ACodeFormatter):
-    pattern = re.compile(r'[^a-zA-Z0-9"]+')
     separator = "-"
 
     def __init__(self, module_name: str, max_length: int) -> None:
         super().__init__(indent="  ", max_length=max_length, module_name=module_name)
+        self._function_name_cache: dict[tuple[tuple[str, ...], bool], str] = {}
 
     def _clean_name(self, name: str) -> str:
-        name = self.pattern.sub(self.separator, name)
-        return name.removeprefix(self.separator).removesuffix(self.separator)
+        return _clean_name(name, self.separator)
 
     def comment(self, *comments: str, chars: str | None = None) -> list[str]:
         chars = chars or ";;"
         if len(comments) == 0:
             return [chars]
-        lines = []
-        for comment in comments:
-            lines.append(f"{chars} {comment}".rstrip())
-        return lines
+        return [f"{chars} {comment}".rstrip() for comment in comments]
 
     def region_comment(self, region: str) -> list[str]:
-        return [";;", *self.comment(region, chars=";;;")]
+        return [";;", f";;; {region}".rstrip()]
 
     def name_to_code(self, name: str) -> str:
         if not (name.startswith("(") and name.endswith(")")):
@@ -57,16 +70,24 @@ class LispCodeFormatter(ACodeFormatter):
         return utils.ensure_ends_with(name, suffix)
 
     def concat_args(self, *args: str) -> str:
-        arg_names = [self.name_to_code(arg) for arg in args]
-        return " ".join(arg_names)
+        return " ".join([self.name_to_code(arg) for arg in args])
 
-    def function_name(self, *name: str, private: bool = False) -> str:
+    def concat_clean_args(self, *args: str) -> str:
+        return " ".join(args)
+
+    def _function_name(self, *name: str, private: bool = False) -> str:
         names = [self.name_to_code(n) for n in name]
         module_name = self.name_to_code(self.module_name)
         if private:
             module_name = f"{module_name}{self.separator}"
         return self.separator.join([module_name, *names])
 
+    def function_name(self, *name: str, private: bool = False) -> str:
+        key = (name, private)
+        if key not in self._function_name_cache:
+            self._function_name_cache[key] = sys.intern(self._function_name(*name, private=private))
+        return self._function_name_cache[key]
+
     def _get_prefix(self, prefix: int, line: str) -> int:
         if prefix == self.prefix_of(line):
             return prefix + 1
@@ -97,7 +118,7 @@ class LispPackageHandler:
     def __init__(self, formatter: LispCodeFormatter, translation: TranslationManager) -> None:
         self.formatter = formatter
         self.translation = translation
-        self._variables = {}
+        self._variables: dict[tuple[str, ...], str] = {}
 
     def _get_names(self, arg: CommandArgs) -> tuple[str, ...]:
         return tuple([value.name for value in arg.constants])
@@ -354,13 +375,15 @@ class CompletingHandler:
 
 class ALispArgCreator(IArgCreator[TArg]):
     def __init__(self, elements: list[TArg], handler: LispPackageHandler) -> None:
-        self.elements = elements
         self.handler = handler
+        self.formatter = handler.formatter
         self.completing = CompletingHandler(handler, self)
+        self.reset(elements)
 
-    @property
-    def formatter(self) -> LispCodeFormatter:
-        return self.handler.formatter
+    def reset(self, elements: list[TArg]) -> None:
+        self.elements = elements
+        # the names are replaced one after the other in the order of the elements
+        self._doc_names = [(elem.name, self.to_doc_name(elem, suffix=None)) for elem in elements]
 
     def valid_description(self, arg: TArg, strip_char: str | None = None) -> list[str]:
         return utils.clean_blank(*arg.description, strip_chars=strip_char)
@@ -375,11 +398,7 @@ class ALispArgCreator(IArgCreator[TArg]):
         return doc_name
 
     def apply_doc_names_to(self, line: str) -> str:
-        if len(self.elements) == 0:
-            return line
-        for elem in self.elements:
-            search = elem.name
-            replace = self.to_doc_name(elem, suffix=None)
+        for search, replace in self._doc_names:
             line = line.replace(search, replace)
         return line
 
@@ -397,7 +416,7 @@ class ALispArgCreator(IArgCreator[TArg]):
     def can_be_interactive(self) -> bool:
         if len(self.elements) == 0:
             return True
-        return all([self.can_arg_be_interactive(arg) for arg in self.elements])
+        return all(self.can_arg_be_interactive(arg) for arg in self.elements)
 
     def is_option_number(self, arg: TArg) -> bool:
         return self.completing.is_read_number(arg)
@@ -420,8 +439,12 @@ class ALispArgCreator(IArgCreator[TArg]):
 
 
 class OptionCreator(ALispArgCreator[CommandOption]):
+    def reset(self, elements: list[CommandOption]) -> None:
+        super().reset(elements)
+        self._arg_names = [self.to_arg(arg) for arg in elements]
+
     def to_args(self) -> list[str]:
-        return [self.to_arg(arg) for arg in self.elements]
+        return self._arg_names
 
     def option_args(self) -> list[CommandOption]:
         return self.elements
@@ -441,23 +464,35 @@ class OptionCreator(ALispArgCreator[CommandOption]):
 
 
 class ArgumentCreator(ALispArgCreator[CommandArgument]):
+    def reset(self, elements: list[CommandArgument]) -> None:
+        super().reset(elements)
+        self._required: list[CommandArgument] = []
+        self._optional: list[CommandArgument] = []
+        for arg in elements:
+            if arg.is_optional():
+                self._optional.append(arg)
+            else:
+                self._required.append(arg)
+        self._arg_names = [self.to_arg(arg) for arg in elements]
+        self._required_names = [self.to_arg(arg) for arg in self._required]
+        self._optional_names = [self.to_arg(arg) for arg in self._optional]
+
     def to_args(self, with_optional: bool = True) -> list[str]:
-        elements = self.elements
         if not with_optional:
-            elements = [arg for arg in elements if arg.is_optional()]
-        return [self.to_arg(arg) for arg in elements]
+            return self._optional_names
+        return self._arg_names
 
     def required_args(self) -> list[CommandArgument]:
-        return [arg for arg in self.elements if not arg.is_optional()]
+        return self._required
 
     def required_arg_names(self) -> list[str]:
-        return [self.to_arg(arg) for arg in self.required_args()]
+        return self._required_names
 
     def optional_args(self) -> list[CommandArgument]:
-        return [arg for arg in self.elements if arg.is_optional()]
+        return self._optional
 
     def optional_arg_names(self) -> list[str]:
-        return [self.to_arg(arg) for arg in self.optional_args()]
+        return self._optional_names
 
     def arg_docstring(self, arg: CommandArgument, **kw: Unpack[FormatterArgs]) -> ArgDoc:
         return ArgDoc(
@@ -500,9 +535,9 @@ class LispCommandDocCreator(ADocCreator):
         return doc_lines
 
     def _replace_single_quotes(self, lines: list[str]) -> list[str]:
-        for idx, line in enumerate(lines):
-            lines[idx] = SINGLE_QUOTE.sub(r" `\1'", line)
-        return lines
+        sub = SINGLE_QUOTE.sub
+        # a quoted value needs an opening and a closing quote
+        return [sub(r" `\1'", line) if line.count("'") > 1 else line for line in lines]
 
     def args_doc(self, docs: list[ArgDoc], **kw: Unpack[FormatterArgs]) -> list[str]:
         kw["columns"] = self._get_max_length(docs, suffix=kw.get("suffix", ":"))
@@ -516,31 +551,38 @@ class LispCommandDocCreator(ADocCreator):
 
 class LispCommandCreator(ICommandCreator):
     def __init__(self, command: ApiCommand, variables: LispPackageHandler) -> None:
-        self.command = command
         self.handler = variables
+        self.formatter = variables.formatter
+        self.manager = variables.translation
         self.opt = OptionCreator(command.options, variables)
         self.arg = ArgumentCreator(command.arguments, variables)
         self.doc = LispCommandDocCreator(formatter=variables.formatter)
+        self.execute_func = pkg.execute_func_name(self.formatter)
+        self.reset(command)
 
-    @property
-    def formatter(self) -> LispCodeFormatter:
-        return self.handler.formatter
-
-    @property
-    def manager(self) -> TranslationManager:
-        return self.handler.translation
+    def reset(self, command: ApiCommand) -> None:
+        self.command = command
+        if self.opt.elements is not command.options:
+            self.opt.reset(command.options)
+        if self.arg.elements is not command.arguments:
+            self.arg.reset(command.arguments)
+        self._signature = self._create_signature()
+        self._call_komorebi = self._create_call_komorebi()
+        self._constant_args = [arg for arg in command.arguments if arg.has_constants()]
+        self._default_args = [arg for arg in self.arg.optional_args() if arg.has_default()]
+        self._is_interactive = self.arg.can_be_interactive() and self.opt.can_be_interactive()
 
     def is_interactive(self) -> bool:
-        return self.arg.can_be_interactive() and self.opt.can_be_interactive()
+        return self._is_interactive
 
     def command_args(self) -> list[str]:
         return self.arg.to_args() + self.opt.to_args()
 
     def function_args(self) -> str:
         arguments = self.arg.required_arg_names()
-        args_str = self.formatter.concat_args(*arguments).strip()
+        args_str = self.formatter.concat_clean_args(*arguments).strip()
         optional = self.arg.optional_arg_names() + self.opt.to_args()
-        optional_str = self.formatter.concat_args(*optional).strip()
+        optional_str = self.formatter.concat_clean_args(*optional).strip()
         if len(args_str) == 0 and len(optional_str) == 0:
             return ""
         if len(optional_str.strip()) == 0:
@@ -553,20 +595,22 @@ class LispCommandCreator(ICommandCreator):
     def autoload_line(self) -> str:
         return self.formatter.indent(";;;###autoload", level=0)
 
-    def _get_signature(self, level: int) -> str:
+    def _create_signature(self) -> str:
         func_kind = "defun"
         func_name = self.function_name()
         func_args = self.function_args()
-        signature = f'({func_kind} {func_name} ({func_args})'
-        return self.formatter.indent(signature, level=level)
+        return f'({func_kind} {func_name} ({func_args})'
+
+    def _create_call_komorebi(self) -> str:
+        return f"({self.execute_func} \"{self.command.name}\" %s"
+
+    def _get_signature(self, level: int) -> str:
+        return self.formatter.indent(self._signature, level=level)
 
     def signature(self, level: int) -> str:
         if not self.is_interactive():
             return self._get_signature(level)
-        return utils.lines_as_str(
-            self.autoload_line(),
-            self._get_signature(level),
-        )
+        return "\n".join((self.autoload_line(), self._get_signature(level)))
 
     def _apply_changes(self, line: str) -> str:
         line = self.arg.apply_doc_names_to(line)
@@ -582,11 +626,16 @@ class LispCommandCreator(ICommandCreator):
     def _ensure_indent(self, line: str) -> str:
         if line.startswith(" "):
             return line
-        lines = line.splitlines(keepends=False)
-        first_line = lines[0]
-        first_line = f"\"{first_line}"
-        lines[0] = self.formatter.indent(first_line, level=1)
-        return utils.lines_as_str(*lines)
+        new_line = line.find("\n")
+        if new_line < 0:
+            return self.formatter.indent(f"\"{line}", level=1)
+        first_line = self.formatter.indent(f"\"{line[:new_line]}", level=1)
+        return f"{first_line}{line[new_line:]}"
+
+    def _iter_doc_lines(self, suffix_args: str, **kw: Unpack[FormatterArgs]) -> Iterable[str]:
+        yield from self.doc.function_doc(lines=self._function_docs(), **kw)
+        kw.update({"default_format": "(default {0})", "suffix": suffix_args})
+        yield from self.doc.args_doc(docs=self._arg_docs(**kw), **kw)
 
     def docstring(
         self, level: int, separator: str = " ", columns: int = 0, suffix_args: str = ":"
@@ -598,12 +647,12 @@ class LispCommandCreator(ICommandCreator):
             "suffix": "",
             "is_code": False,
         }
-        doc_lines = self.doc.function_doc(lines=self._function_docs(), **kw)
-        kw.update({"default_format": "(default {0})", "suffix": suffix_args})
-        doc_lines.extend(self.doc.args_doc(docs=self._arg_docs(**kw), **kw))
+        doc_lines = list(self._iter_doc_lines(suffix_args, **kw))
+        if len(doc_lines) == 0:
+            return ""
         doc_lines = self.doc.quote_doc_end(doc_lines)
         doc_lines = self.doc.quote_doc_start(doc_lines, level=level)
-        return utils.lines_as_str(*doc_lines)
+        return "\n".join([line for line in doc_lines if len(line) > 0])
 
     def code(self, **kw: Unpack[FormatterArgs]) -> str:
         kw["is_code"] = True
@@ -614,7 +663,7 @@ class LispCommandCreator(ICommandCreator):
         lines.extend(self._function_body_convert_args(kw.get("level", 1)))
         args = self.command_args()
         lines.extend(self._function_body_call_komorebi(self.command.name, args, **kw))
-        return utils.lines_as_str(*lines)
+        return "\n".join(lines)
 
     def _function_body_interactive(self, **kw: Unpack[FormatterArgs]) -> list[str]:
         if not self.is_interactive():
@@ -632,8 +681,10 @@ class LispCommandCreator(ICommandCreator):
             else:
                 ctx.create_with_list_on_second_line()
                 ctx.create()
-        lines = helper.as_list()
-        lines[-1] = lines[-1].rstrip() + ")"
+        return self._close_expression(helper.as_list())
+
+    def _close_expression(self, lines: list[str], brackets: str = ")") -> list[str]:
+        lines[-1] = "".join((lines[-1].rstrip(), brackets))
         return lines
 
     def _get_check_value_code_line(self, argument: CommandArgument, level: int) -> str:
@@ -645,17 +696,17 @@ class LispCommandCreator(ICommandCreator):
     def _check_constant_code(self, argument: CommandArgument, **kw: Unpack[FormatterArgs]) -> list[str]:
         arg_name = self.arg.to_arg(argument)
         level = kw.get("level", 1)
-        code_line = self._get_check_value_code_line(argument, level=level)
-        lines = [code_line]
         message = f"(error \"Invalid value for '{arg_name}' %S\" {arg_name}))"
-        lines.append(self.formatter.indent(message, level=level + 1))
-        return lines
+        return [
+            self._get_check_value_code_line(argument, level=level),
+            self.formatter.indent(message, level=level + 1),
+        ]
 
     def _function_body_check_constants(self, **kw: Unpack[FormatterArgs]) -> list[str]:
+        if len(self._constant_args) == 0:
+            return []
         lines = []
-        for argument in self.command.arguments:
-            if not argument.has_constants():
-                continue
+        for argument in self._constant_args:
             lines.extend(self._check_constant_code(argument, **kw))
         return lines
 
@@ -689,8 +740,7 @@ class LispCommandCreator(ICommandCreator):
         lines = [self._expression(f"if (= {arg_name} {default})", level=level)]
         lines.append(self._setq_line(arg_name, "nil", level=level + 2))
         lines.append(self._get_option_value(option, level=level + 1))
-        lines[-1] = lines[-1].rstrip() + ")"
-        return lines
+        return self._close_expression(lines)
 
     def _set_option_value(self, option: CommandOption, level: int) -> list[str]:
         arg_name = self.opt.to_arg(option)
@@ -703,8 +753,7 @@ class LispCommandCreator(ICommandCreator):
             lines.extend(self._get_option_numebr_value(option, level=level + 1))
         else:
             lines.append(self._get_option_value(option, level=level + 1))
-        lines[-1] = lines[-1].rstrip() + ")"
-        return lines
+        return self._close_expression(lines)
 
     def _set_argument_value(self, argument: CommandArgument, level: int) -> list[str]:
         if not argument.has_default():
@@ -712,12 +761,11 @@ class LispCommandCreator(ICommandCreator):
         arg_name = self.arg.to_arg(argument)
         lines = [self._expression(f"unless {arg_name}", level=level)]
         lines.append(self._setq_line(arg_name, f"\"{argument.default}\"", level=level + 1))
-        lines[-1] = lines[-1].rstrip() + ")"
-        return lines
+        return self._close_expression(lines)
 
     def _function_body_convert_args(self, level: int) -> list[str]:
         lines = []
-        for argument in self.arg.optional_args():
+        for argument in self._default_args:
             lines.extend(self._set_argument_value(argument, level=level))
         for option in self.opt.option_args():
             lines.extend(self._set_option_value(option, level=level))
@@ -772,9 +820,9 @@ class LispCommandCreator(ICommandCreator):
         return cmd_lines
 
     def _function_body_call_komorebi(self, cmd_name: str, args: list[str], **kw: Unpack[FormatterArgs]) -> list[str]:
-        args_str = f"{self.formatter.concat_args(*args)}" if len(args) > 0 else ""
-        command_str = f"({pkg.execute_func_name(self.formatter)} \"{cmd_name}\" {args_str}"
-        command_str = self.formatter.indent(command_str, kw.get("level", 1)).rstrip() + "))"
+        args_str = self.formatter.concat_clean_args(*args)
+        call_str = self.formatter.indent(self._call_komorebi % args_str, kw.get("level", 1))
+        command_str = "".join((call_str.rstrip(), "))"))
         if self.formatter.is_valid_line(command_str, **kw):
             return [command_str]
         cmd_lines = self._function_call_many_lines(command_str, **kw)
@@ -1,19 +1,17 @@
-import re
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import Iterable, Unpack
 
-from pyKomorebi import utils
 from pyKomorebi.creator import TranslationManager
-from pyKomorebi.creator import code as code_utils
 from pyKomorebi.creator.code import ACodeCreator, FormatterArgs
 from pyKomorebi.creator.lisp import package as pkg
 from pyKomorebi.creator.lisp.code import LispCodeFormatter, LispCommandCreator, LispPackageHandler
 from pyKomorebi.creator.lisp.helper.list import ListHelper
 from pyKomorebi.model import ApiCommand
 
-CLEANUP_PATTERN = [
-    re.compile(r"(\(without.*?\))"),
-]
+
+_DOC_TMPL = "\"List of possible values for `{name}'.\")"
 
 
 class LispCreator(ACodeCreator):
@@ -28,61 +26,71 @@ class LispCreator(ACodeCreator):
             max_length=max_length,
         )
         self.var_hanlder = LispPackageHandler(self.formatter, manager)
-
-    def _ensure_autoload_line_indent(self, lines: list[str]) -> list[str]:
-        for idx, line in enumerate(lines):
-            if self.autoload_line in line:
-                lines[idx] = line.lstrip()
-        return lines
+        self._creator: LispCommandCreator | None = None
 
     def setup_package_handler(self, commands: Iterable[ApiCommand]) -> None:
         self.var_hanlder = LispPackageHandler(self.formatter, self.manager)
+        self._creator = None
         for command in commands:
-            for arg in command.arguments:
+            for arg in chain(command.arguments, command.options):
                 self.var_hanlder.add(arg)
-            for opt in command.options:
-                self.var_hanlder.add(opt)
 
     def variable_doc_string(self, arg_name: str, **kw: Unpack[FormatterArgs]) -> list[str]:
-        kw["is_code"] = False
         arg_name = self.formatter.remove_module_prefix(arg_name)
-        doc_str = f"\"List of possible values for `{arg_name}'.\""
-        doc_str = utils.ensure_ends_with(doc_str, end_str=")")
-        kw = code_utils.with_level(kw)
-        return [self.formatter.indent(doc_str, level=kw.get("level", 1))]
+        doc_str = _DOC_TMPL.format(name=arg_name)
+        return [self.formatter.indent(doc_str, level=kw.get("level", 0) + 1)]
 
     def variables(self) -> list[str]:
         lines = []
-        variables = sorted(self.var_hanlder.items(), key=lambda x: x[0])
+        variables = sorted(self.var_hanlder.items(), key=itemgetter(0))
         helper = ListHelper[str](formatter=self.formatter)
         kwargs = {"level": 0, "separator": " ", "is_code": True}
         for name, values in variables:
             var_name = f"(defvar {name}"
             values = [f'"{value}"' for value in values]
-            with helper.with_context(previous_code=var_name, items=values, **kwargs) as ctx:
-                if ctx.found_solution():
-                    ctx.create()
-            lines.extend(helper.as_list())
+            single_line = f"{var_name} {helper.start_str} {self.formatter.concat_args(*values)})"
+            if len(single_line) <= self.max_length:
+                lines.append(single_line)
+            else:
+                with helper.with_context(previous_code=var_name, items=values, **kwargs) as ctx:
+                    if ctx.found_solution():
+                        ctx.create()
+                lines.extend(helper.as_list())
             lines.extend(self.variable_doc_string(name, **kwargs))
             lines.extend(self.formatter.empty_line(count=1))
         return lines
 
+    def _command_creator(self, command: ApiCommand) -> LispCommandCreator:
+        if self._creator is None:
+            self._creator = LispCommandCreator(command=command, variables=self.var_hanlder)
+        else:
+            self._creator.reset(command)
+        return self._creator
+
     def command(self, command: ApiCommand) -> list[str]:
         command.remove_help_option()
-        creator = LispCommandCreator(command=command, variables=self.var_hanlder)
-        lines = []
-        lines.append(creator.signature(level=0))
-        lines.append(
-            creator.docstring(
-                separator=" ",
-                level=1,
-                suffix_args=":",
-            )
-        )
-        lines.append(creator.code(level=1, separator=" "))
-        return self._ensure_autoload_line_indent(lines)
+        creator = self._command_creator(command)
+        signature = creator.signature(level=0)
+        # only the signature starts with the autoload line
+        if signature.lstrip().startswith(self.autoload_line):
+            signature = signature.lstrip()
+        return [
+            signature,
+            creator.docstring(separator=" ", level=1, suffix_args=":"),
+            creator.code(level=1, separator=" "),
+        ]
 
-    def generate(self, commands: Iterable[ApiCommand]) -> list[str]:
+    def _iter_lines(self, commands: Iterable[ApiCommand], package_info: pkg.PackageInfo) -> Iterable[str]:
+        yield from pkg.pre_generator(package_info)
+        yield from self.variables()
+        command_separator = self.formatter.empty_line(count=2)
+        for command in commands:
+            yield from command_separator
+            yield from self.command(command)
+        yield from command_separator
+        yield from pkg.post_generator(package_info)
+
+    def generate(self, commands: Iterable[ApiCommand]) -> Iterable[str]:
         package_info = pkg.PackageInfo(
             name=self.formatter.module_name,
             version="0.0.2",
@@ -92,13 +100,5 @@ class LispCreator(ACodeCreator):
             emacs_version="28.1",
             formatter=self.formatter,
         )
-        self.var_hanlder = LispPackageHandler(self.formatter, self.manager)
         self.setup_package_handler(commands)
-        lines = pkg.pre_generator(package_info)
-        lines.extend(self.variables())
-        for command in commands:
-            lines.extend(self.formatter.empty_line(count=2))
-            lines.extend(self.command(command=command))
-        lines.extend(self.formatter.empty_line(count=2))
-        lines.extend(pkg.post_generator(package_info))
-        return lines
+        return self._iter_lines(commands, package_info)
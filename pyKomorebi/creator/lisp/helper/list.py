@@ -1,5 +1,4 @@
-import re
-from typing import Generic, TypeGuard, TypeVar, Unpack
+from typing import Generic, TypeVar, Unpack, cast
 
 from pyKomorebi import utils
 from pyKomorebi.creator import code as code_utils
@@ -12,13 +11,14 @@ TItem = TypeVar("TItem", str, list[str])
 class ListHelper(Generic[TItem]):
     start_str = "(list"
     close_str = ")"
-    pair_pattern = re.compile(r"\((.*?)\)")
 
     def __init__(self, formatter: ICodeFormatter):
         self.formatter = formatter
         self.prev_code = ""
         self.args: FormatterArgs = FormatterArgs(separator=" ")
         self.items: list[TItem] = []
+        self._item_is_list: list[bool] = []
+        self._all_strings = True
         self._values: list[str] = []
         self._valid_list = False
 
@@ -27,19 +27,44 @@ class ListHelper(Generic[TItem]):
 
     def _get_line(self, values: list[str], **kw: Unpack[FormatterArgs]) -> str:
         lines = self.formatter.concat_values(*values, **kw)
-        as_str = utils.lines_as_str(*lines)
+        if len(lines) == 1:
+            as_str = lines[0]
+        else:
+            as_str = "\n".join([line for line in lines if len(line) > 0])
         if as_str.startswith("  "):
             return as_str
         return self.formatter.indent(as_str, level=kw.get("level", 0), prefix=kw.get("prefix", 0))
 
+    def _line_length(self, values: list[str], **kw: Unpack[FormatterArgs]) -> int:
+        # same length as _get_line without joining and indenting the lines
+        lines = self.formatter.concat_values(*values, **kw)
+        if len(lines) > 1:
+            lines = [line for line in lines if len(line) > 0]
+        length = sum(len(line) for line in lines) + max(len(lines) - 1, 0)
+        if len(lines) > 0 and lines[0].startswith("  "):
+            return length
+        indent = self.formatter.indent_for(kw.get("level", 0), kw.get("prefix", 0))
+        return len(indent) + length
+
+    def _fits_until(self, values: list[str], index: int, **kw: Unpack[FormatterArgs]) -> bool:
+        return self._line_length(values[:index], **kw) <= self.formatter.max_length
+
     def _last_valid_index(self, values: list[str], **kw: Unpack[FormatterArgs]) -> int:
         if len(values) == 0:
             return -1
-        for idx in range(len(values), -1, -1):
-            line = self._get_line(list(values[:idx]), **kw)
-            if self.formatter.is_not_max_length(line):
-                return idx
-        return -1
+        if self._fits_until(values, len(values), **kw):
+            return len(values)
+        # the line only grows with more values, so the last fitting index can be bisected
+        low, high = 0, len(values) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._fits_until(values, middle, **kw):
+                low = middle
+            else:
+                high = middle - 1
+        if low == 0 and not self._fits_until(values, 0, **kw):
+            return -1
+        return low
 
     def _list_line_exists(self, lines: list[str]) -> bool:
         for line in lines:
@@ -49,7 +74,7 @@ class ListHelper(Generic[TItem]):
         return False
 
     def _min_or_prefix(self, lines: list[str], prefix: int) -> int:
-        level_one_prefix = len(self.formatter.indent_for(level=1))
+        level_one_prefix = len(self.formatter.level_indent(1))
         if len(lines) == 0:
             return level_one_prefix
         first_line = lines[0].rstrip()
@@ -98,15 +123,15 @@ class ListHelper(Generic[TItem]):
         else:
             return self._min_or_prefix(lines, list_idx)
 
-    def _open_bracket_count(self, lines: list[str]) -> int:
-        return sum([line.count("(") for line in lines])
-
-    def _close_bracket_count(self, lines: list[str]) -> int:
-        return sum([line.count(")") for line in lines])
+    def _bracket_counts(self, lines: list[str]) -> tuple[int, int]:
+        open_brackets = close_brackets = 0
+        for line in lines:
+            open_brackets += line.count("(")
+            close_brackets += line.count(")")
+        return open_brackets, close_brackets
 
     def _has_closed_command(self, lines: list[str]) -> bool:
-        open_brackets = self._open_bracket_count(lines)
-        close_brackets = self._close_bracket_count(lines)
+        open_brackets, close_brackets = self._bracket_counts(lines)
         if close_brackets == 0:
             return False
         return (open_brackets - close_brackets) == 2
@@ -114,14 +139,11 @@ class ListHelper(Generic[TItem]):
     def _get_opening_line(self, lines: list[str]) -> str | None:
         if len(lines) == 0:
             return None
-        for idx in range(len(lines), -1, -1):
-            if idx < 0 or idx >= len(lines):
+        for line in reversed(lines):
+            if line.endswith("))") or line.rfind("(") < 0:
                 continue
-            if lines[idx].endswith("))"):
-                continue
-            if lines[idx].rfind("(") < 0:
-                continue
-            return lines[idx]
+            return line
+        # a closed expression on the last line is still an opening line
         if ")" in lines[-1] and "(" in lines[-1]:
             return lines[-1]
         return None
@@ -147,17 +169,26 @@ class ListHelper(Generic[TItem]):
         return False
 
     def create_list_str(self, *list_item: TItem, **kw: Unpack[FormatterArgs]) -> list[str]:
-        items = list(self._values)
+        items = self._values.copy()
+        # the previous code is only emitted on the level of the list itself
+        same_level = kw.get("level") == self.args.get("level")
+        prev_code_exists = not same_level or self._exists(self.prev_code, items)
+        start_exists = self._exists(self.start_str, items)
         last_expr = (-1, -1)
         for item in list_item:
             values = []
-            if kw.get("level") == self.args.get("level") and not self._exists(self.prev_code, items):
+            if not prev_code_exists:
                 values = self._previous_code()
-            if not self._exists(self.start_str, items):
+                prev_code_exists = True
+            if not start_exists:
                 values.append(self.start_str)
-            values.extend([item] if isinstance(item, str) else list(item))
+                start_exists = True
+            if isinstance(item, str):
+                values.append(item)
+            else:
+                values.extend(item)
             if not isinstance(item, list):
-                line = utils.as_string(*values, separator=" ")
+                line = " ".join([value for value in values if len(value) > 0])
                 items.append(self.formatter.indent(line, level=kw.get("level", 0)))
                 continue
             index = self._last_valid_index(values, **kw)
@@ -171,7 +202,7 @@ class ListHelper(Generic[TItem]):
                 last_col = items[last_row].find(item[0]) - 2
                 last_expr = (last_row, last_col)
                 kw["prefix"] = self._get_prefix(items, **kw)
-                values = values[index:]
+                del values[:index]
             if len(values) == 0:
                 kw["prefix"] = self._min_or_prefix(items, last_expr[1])
                 continue
@@ -183,29 +214,23 @@ class ListHelper(Generic[TItem]):
             elif len(values) > 1:
                 kw["prefix"] = self._get_prefix(items, **kw)
                 last_row = len(items)
-                items.extend(self.formatter.concat_values(values[0], **kw))
+                items.extend(self.formatter.concat_one(values[0], **kw))
                 last_col = items[last_row].find(item[0]) - 2
                 last_expr = (last_row, last_col)
                 kw["prefix"] = self._get_prefix(items, **kw)
                 items.extend(self.formatter.concat_values(*values[1:], **kw))
         return items
 
-    def _is_list_of_strings(self, values: list[TItem]) -> TypeGuard[list[str]]:
-        return all(isinstance(value, str) for value in values)
-
     def _create_list(self, all_items: bool, **kw: Unpack[FormatterArgs]) -> None:
         if all_items:
-            if self._is_list_of_strings(self.items):
-                items = [self.formatter.concat_args(*self.items)]
+            if self._all_strings:
+                items = cast(list[TItem], [self.formatter.concat_args(*cast(list[str], self.items))])
             else:
                 items = list(self.items)
         else:
             items = [self.items[0]]
         kw["prefix"] = self._min_or_prefix(self._values, prefix=0)
-        if len(self._values) == 0:
-            self._values.extend(self.create_list_str(*items, **kw.copy()))  # type: ignore
-        else:
-            self._values = self.create_list_str(*items, **kw.copy())  # type: ignore
+        self._values = self.create_list_str(*items, **kw)
         self._values.extend(self._append_other_items(all_items, **kw))
 
     def _append_other_items(self, all_items: bool, **kw: Unpack[FormatterArgs]) -> list[str]:
@@ -218,17 +243,16 @@ class ListHelper(Generic[TItem]):
         else:
             kw["prefix"] = self.formatter.find_prefix_in_code(self._values[-1], **kw)
         values = []
-        for item in self.items[1:]:
-            if isinstance(item, list):
+        for idx in range(1, len(self.items)):
+            item = self.items[idx]
+            if self._item_is_list[idx]:
                 if len(item) == 0:
                     continue
-                if len(item) == 1:
-                    values.extend(self.formatter.concat_values(*item, **kw))
-                else:
-                    values.extend(self.formatter.concat_values(item[0], **kw))
+                values.extend(self.formatter.concat_one(item[0], **kw))
+                if len(item) > 1:
                     kw["prefix"] = self._get_prefix(values, **kw)
                     values.extend(self.formatter.concat_values(*item[1:], **kw))
-            elif isinstance(item, str):
+            else:
                 prefix = kw.get("prefix", 0)
                 level = kw.get("level", 0)
                 item_str = self.formatter.indent(item, level=level, prefix=prefix)
@@ -288,8 +312,18 @@ class ListHelper(Generic[TItem]):
         self._create_list(all_items=False, **kwargs)
         return True
 
+    def _fits_single_line(self) -> bool:
+        if not self._all_strings:
+            return True
+        # lower bound of the single line, the indent is not counted
+        items_str = self.formatter.concat_args(*cast(list[str], self.items))
+        length = len(self.prev_code) + 1 + len(self.start_str)
+        if len(items_str) > 0:
+            length += 1 + len(items_str)
+        return length <= self.formatter.max_length
+
     def found_solution(self) -> bool:
-        if self.can_create_all_on(second_line=False):
+        if self._fits_single_line() and self.can_create_all_on(second_line=False):
             return True
         if self.can_create_with_first_on(second_line=False):
             return True
@@ -303,8 +337,9 @@ class ListHelper(Generic[TItem]):
         self._values[-1] = f"{self._values[-1]})"
 
     def as_str(self) -> str:
-        value = utils.lines_as_str(*self._values)
-        return value
+        if len(self._values) == 1:
+            return self._values[0]
+        return "\n".join([line for line in self._values if len(line) > 0])
 
     def as_list(self) -> list[str]:
         values = list(self._values)
@@ -313,6 +348,8 @@ class ListHelper(Generic[TItem]):
     def reset(self) -> None:
         self.prev_code = ""
         self.items = []
+        self._item_is_list = []
+        self._all_strings = True
         self.args = FormatterArgs(separator=" ")
         self._values = []
 
@@ -320,6 +357,8 @@ class ListHelper(Generic[TItem]):
         self.reset()
         self.prev_code = previous_code
         self.items = items
+        self._item_is_list = [isinstance(item, list) for item in items]
+        self._all_strings = not any(self._item_is_list)
         self.args = kw
         return self
 
@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 
 
-from pyKomorebi import utils
 from pyKomorebi.creator.code import ICodeFormatter
 
 
@@ -26,6 +26,9 @@ class FunctionNames:
         return formatter.function_name(self.args_func_name, private=True)
 
 
+FUNC_NAMES = FunctionNames()
+
+
 @dataclass
 class PackageInfo:
     name: str
@@ -35,18 +38,35 @@ class PackageInfo:
     user_email: str
     emacs_version: str
     formatter: ICodeFormatter
+    _now: datetime = field(default_factory=datetime.now, init=False, repr=False)
 
     @property
     def user_and_email(self) -> str:
         return f"{self.user_name} <{self.user_email}>"
 
-    @property
+    @cached_property
+    def executable_var(self) -> str:
+        return FUNC_NAMES.executable_var(self.formatter)
+
+    @cached_property
+    def ensure_string_func(self) -> str:
+        return FUNC_NAMES.ensure_string_func(self.formatter)
+
+    @cached_property
+    def args_func(self) -> str:
+        return FUNC_NAMES.args_func(self.formatter)
+
+    @cached_property
+    def execute_func(self) -> str:
+        return FUNC_NAMES.execute_func(self.formatter)
+
+    @cached_property
     def modified(self) -> str:
-        return datetime.now().strftime("%B %d, %Y")
+        return self._now.strftime("%B %d, %Y")
 
-    @property
+    @cached_property
     def year(self) -> str:
-        return datetime.now().strftime("%Y")
+        return self._now.strftime("%Y")
 
     def comment(self, *values: str, chars: str = ";;") -> list[str]:
         return self.formatter.comment(*values, chars=chars)
@@ -62,31 +82,46 @@ class PackageInfo:
 
     def prefix(self, line: str, prefix: int) -> str:
         column = self.formatter.column_prefix(prefix)
-        return utils.as_string(column, line, separator=" ")
+        if len(column) == 0:
+            return line
+        return f"{column} {line}"
+
+
+_PACKAGE_DESCRIPTION = """\
+;;; {name}.el --- Description -*- lexical-binding: t; -*-
+;;
+;; Copyright (C) {year} {user_name}
+;;
+;; Author: {user_and_email}
+;; Maintainer: {user_and_email}
+;; Created: Oktober 07, 2024
+;; Modified: {modified}
+;; Version: {version}
+;; Keywords: docs emulations extensions help languages lisp local processes
+;; Homepage: {repository}
+;; Package-Requires: ((emacs "{emacs_version}"))
+;;
+;; This file is not part of GNU Emacs.
+;;
+;;; Commentary:
+;;
+;;; Description
+;;
+;;; Code:"""
 
 
 def _package_descriptions(info: PackageInfo) -> list[str]:
-    lines = info.empty_line(count=0)
-    lines.extend(info.comment(f"{info.name}.el --- Description -*- lexical-binding: t; -*-", chars=";;;"))
-    lines.extend(info.comment())
-    lines.extend(info.comment(f"Copyright (C) {info.year} {info.user_name}"))
-    lines.extend(info.comment())
-    lines.extend(info.comment(f"Author: {info.user_and_email}"))
-    lines.extend(info.comment(f"Maintainer: {info.user_and_email}"))
-    lines.extend(info.comment("Created: Oktober 07, 2024"))
-    lines.extend(info.comment(f"Modified: {info.modified}"))
-    lines.extend(info.comment(f"Version: {info.version}"))
-    lines.extend(info.comment("Keywords: docs emulations extensions help languages lisp local processes"))
-    lines.extend(info.comment(f"Homepage: {info.repository}"))
-    lines.extend(info.comment(f'Package-Requires: ((emacs "{info.emacs_version}"))'))
-    lines.extend(info.comment())
-    lines.extend(info.comment("This file is not part of GNU Emacs."))
-    lines.extend(info.comment())
-    lines.extend(info.comment("Commentary:", chars=";;;"))
-    lines.extend(info.comment())
-    lines.extend(info.comment("Description", chars=";;;"))
-    lines.extend(info.comment())
-    lines.extend(info.comment("Code:", chars=";;;"))
+    description = _PACKAGE_DESCRIPTION.format(
+        name=info.name,
+        year=info.year,
+        user_name=info.user_name,
+        user_and_email=info.user_and_email,
+        modified=info.modified,
+        version=info.version,
+        repository=info.repository,
+        emacs_version=info.emacs_version,
+    )
+    lines = [line.rstrip() for line in description.splitlines()]
     lines.extend(info.formatter.empty_line(count=2))
     return lines
 
@@ -101,148 +136,114 @@ def _require_packages(info: PackageInfo) -> list[str]:
     return lines
 
 
-def _executable_var(info: PackageInfo) -> str:
-    func_names = FunctionNames()
-    return func_names.executable_var(info.formatter)
+_CUSTOM_EXECUTABLE = """\
+(defcustom {executable} ""
+  "The path to the komorebi executable."
+  :type 'string
+  :group '{name})"""
 
 
 def _custom_executable(info: PackageInfo) -> list[str]:
-    lines = info.empty_line(count=2)
-    lines.append(info.indent(f"(defcustom {_executable_var(info)} \"\"", level=0))
-    lines.append(info.indent("\"The path to the komorebi executable.\"", level=1))
-    lines.append(info.indent(":type 'string", level=1))
-    lines.append(info.indent(f":group '{info.name})", level=1))
-    return lines
+    code = _CUSTOM_EXECUTABLE.format(executable=info.executable_var, name=info.name)
+    return [*info.empty_line(count=2), *code.splitlines()]
 
 
-def _ensure_string_func(info: PackageInfo) -> str:
-    func_names = FunctionNames()
-    return func_names.ensure_string_func(info.formatter)
+_ENSURE_ARGS_ARE_STRING = """\
+(defun {ensure_string} (args)
+  "Ensure that ARGS are strings."
+  (seq-map (lambda (arg)
+             (cond ((numberp arg) (number-to-string arg))
+                   ((stringp arg) arg)
+                   (t (error (format "Invalid argument: %S" arg)))))
+           args))"""
 
 
 def _ensure_args_are_string(info: PackageInfo) -> list[str]:
-    lines = info.empty_line(count=2)
-    lines.append(info.indent(f"(defun {_ensure_string_func(info)} (args)", level=0))
-    lines.append(info.indent("\"Ensure that ARGS are strings.\"", level=1))
-    lines.append(info.indent("(seq-map (lambda (arg)", level=1))
-    pre_lambda = lines[-1].find("(lambda (arg)") - 1
-    lines.append(info.prefix("(cond ((numberp arg) (number-to-string arg))", prefix=pre_lambda + 2))
-    pre_cond = lines[-1].find("((") - 1
-    lines.append(info.prefix("((stringp arg) arg)", prefix=pre_cond))
-    lines.append(info.prefix("(t (error (format \"Invalid argument: %S\" arg)))))", prefix=pre_cond))
-    lines.append(info.prefix("args))", prefix=pre_lambda))
-    return lines
+    code = _ENSURE_ARGS_ARE_STRING.format(ensure_string=info.ensure_string_func)
+    return [*info.empty_line(count=2), *code.splitlines()]
 
 
-def _args_func(info: PackageInfo) -> str:
-    func_names = FunctionNames()
-    return func_names.args_func(info.formatter)
+_GET_ARGS_FUNCTION = """\
+(defun {args_get} (args)
+  "Return string of ARGS."
+  (string-join
+   ({ensure_string}
+    (seq-filter
+     (lambda (arg)
+       (unless (null arg)
+         (or (numberp arg) (stringp arg)
+             (not (string-empty-p arg)))))
+     args))
+   " "))"""
 
 
 def _get_args_function(info: PackageInfo) -> list[str]:
-    lines = info.empty_line(count=2)
-    lines.append(info.indent(f"(defun {_args_func(info)} (args)", level=0))
-    lines.append(info.indent("\"Return string of ARGS.\"", level=1))
-    lines.append(info.indent("(string-join", level=1))
-    pre_join = len(info.formatter.indent_for(level=1))
-    lines.append(info.prefix(f"({_ensure_string_func(info)}", prefix=pre_join))
-    pre_ensure = lines[-1].find(f"({_ensure_string_func(info)}")
-    lines.append(info.prefix("(seq-filter", prefix=pre_ensure))
-    pre_pred = pre_ensure + 1
-    lines.append(info.prefix("(lambda (arg)", prefix=pre_pred))
-    pre_filter = lines[-1].find("(lambda (arg)") - 1
-    pre_lambda = pre_filter + 2
-    lines.append(info.prefix("(unless (null arg)", prefix=pre_lambda))
-    pre_unless = lines[-1].find("(unless") + 1
-    lines.append(info.prefix("(or (numberp arg) (stringp arg)", prefix=pre_unless))
-    pre_num = lines[-1].find("(numberp") - 1
-    lines.append(info.prefix("(not (string-empty-p arg)))))", prefix=pre_num))
-    lines.append(info.prefix("args))", prefix=pre_filter))
-    lines.append(info.prefix('" "))', prefix=pre_join))
-    return lines
+    code = _GET_ARGS_FUNCTION.format(args_get=info.args_func, ensure_string=info.ensure_string_func)
+    return [*info.empty_line(count=2), *code.splitlines()]
 
 
 def execute_func_name(formatter: ICodeFormatter) -> str:
-    func_names = FunctionNames()
-    return func_names.execute_func(formatter)
+    return FUNC_NAMES.execute_func(formatter)
 
 
 def execute_func(info: PackageInfo) -> str:
-    return execute_func_name(info.formatter)
-
-
-def _executable_is_set_check(info: PackageInfo, level: int) -> list[str]:
-    lines = info.empty_line(count=0)
-    exe_path = _executable_var(info)
-    lines.append(info.indent(f"(unless (and {exe_path}", level=level))
-    pre_empty = lines[-1].find(f"{exe_path}") - 1
-    lines.append(info.prefix(f"(length> {exe_path} 0))", prefix=pre_empty))
-    return lines
-
-
-def _executable_is_set_message(info: PackageInfo, level: int) -> list[str]:
-    lines = info.empty_line(count=0)
-    exe_path = _executable_var(info)
-    lines.append(info.indent("(error (string-join", level=level + 1))
-    pre_message = lines[-1].find("(string-join")
-    lines.append(info.prefix(f"(list \"`{exe_path}' variable not set.\"", prefix=pre_message))
-    pre_exe = lines[-1].find(f" \"`{exe_path}'")
-    message = "\"Please set it to the path of the komorebic executable.\")"
-    lines.append(info.prefix(message, prefix=pre_exe))
-    lines.append(info.prefix("\" \")))", prefix=pre_message))
-    return lines
-
-
-def _executable_exists_check(info: PackageInfo, level: int) -> list[str]:
-    lines = info.empty_line(count=0)
-    exe_path = _executable_var(info)
-    message = f"(format \"%s does not exist.\" {exe_path})"
-    lines.append(info.indent(f"(unless (file-exists-p {exe_path})", level=level))
-    lines.append(info.indent(f"(error {message}))", level=level + 1))
-    return lines
+    return info.execute_func
+
+
+_EXECUTE_COMMAND = """\
+(defun {execute} (command &rest args)
+  "Execute komorebi COMMAND with ARGS in shell."
+  (unless (and {executable}
+               (length> {executable} 0))
+    (error (string-join
+            (list "`{executable}' variable not set."
+                  "Please set it to the path of the komorebic executable.")
+            " ")))
+  (unless (file-exists-p {executable})
+    (error (format "%s does not exist." {executable})))
+  (let* ((shell-cmd (format "%s %s %s"
+                            (shell-quote-argument {executable})
+                            command
+                            ({args_get} args)))
+         (result (string-trim
+                  (shell-command-to-string shell-cmd))))
+    (if (string-empty-p result)
+        (message "Command: %S executed" command)
+      (message "Command %S executed > %s" command result))
+    result))"""
 
 
 def _execute_command(info: PackageInfo) -> list[str]:
-    exe_path = _executable_var(info)
-    lines = info.empty_line(count=2)
-    lines.append(info.indent(f"(defun {execute_func(info)} (command &rest args)", level=0))
-    lines.append(info.indent("\"Execute komorebi COMMAND with ARGS in shell.\"", level=1))
-    lines.extend(_executable_is_set_check(info, level=1))
-    lines.extend(_executable_is_set_message(info, level=1))
-    lines.extend(_executable_exists_check(info, level=1))
-    lines.append(info.indent("(let* ((shell-cmd (format \"%s %s %s\"", level=1))
-    pre_result = lines[-1].find("(shell-cmd") - 1
-    pre_format = lines[-1].find("\"%s %s %s\"") - 1
-    lines.append(info.prefix(f"(shell-quote-argument {exe_path})", prefix=pre_format))
-    lines.append(info.prefix("command", prefix=pre_format))
-    lines.append(info.prefix(f"({_args_func(info)} args)))", prefix=pre_format))
-    lines.append(info.prefix("(result (string-trim", prefix=pre_result))
-    pre_trim = lines[-1].find("(string-trim")
-    lines.append(info.prefix("(shell-command-to-string shell-cmd))))", prefix=pre_trim))
-    lines.append(info.indent("(if (string-empty-p result)", level=2))
-    lines.append(info.indent("(message \"Command: %S executed\" command)", level=4))
-    lines.append(info.indent("(message \"Command %S executed > %s\" command result))", level=3))
-    lines.append(info.indent("result))", level=2))
-    return lines
+    code = _EXECUTE_COMMAND.format(
+        execute=info.execute_func,
+        executable=info.executable_var,
+        args_get=info.args_func,
+    )
+    return [*info.empty_line(count=2), *code.splitlines()]
 
 
-def pre_generator(info: PackageInfo) -> list[str]:
-    lines = info.empty_line(count=0)
-    lines.extend(_package_descriptions(info))
-    lines.extend(info.region("Code generated by pyKomorebi.py"))
-    lines.extend(_require_packages(info))
+def _package_functions(info: PackageInfo) -> list[str]:
+    lines = _require_packages(info)
     lines.extend(_custom_executable(info))
     lines.extend(_ensure_args_are_string(info))
     lines.extend(_get_args_function(info))
     lines.extend(_execute_command(info))
-    lines.extend(info.empty_line(count=2))
-    lines.extend(info.region("Generated CLI Commands"))
-    lines.extend(info.empty_line(count=2))
     return lines
 
 
+def pre_generator(info: PackageInfo) -> list[str]:
+    return [
+        *_package_descriptions(info),
+        *info.region("Code generated by pyKomorebi.py"),
+        *_package_functions(info),
+        *info.empty_line(count=2),
+        *info.region("Generated CLI Commands"),
+        *info.empty_line(count=2),
+    ]
+
+
 def post_generator(info: PackageInfo) -> list[str]:
-    lines = info.empty_line(count=0)
-    lines.append(info.indent(f"(provide '{info.name})"))
-    lines.extend(info.comment(f"{info.name}.el ends here", chars=";;;"))
-    return lines
+    return [
+        info.indent(f"(provide '{info.name})"),
+        f";;; {info.name}.el ends here",
+    ]
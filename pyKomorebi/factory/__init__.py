@@ -1,15 +1,24 @@
 """Factory module for creating ApiCommand objects from files."""
 
+from functools import lru_cache
+from importlib import import_module
 
-def get(extension: str):
-    if not extension.startswith("."):
-        raise ValueError(f"Extension '{extension}' must start with a period")
-    if extension.endswith(".cmd"):
-        from pyKomorebi.factory import console
+_FACTORY_MODULES = (
+    (".cmd", "pyKomorebi.factory.console"),
+    (".md", "pyKomorebi.factory.markdown"),
+)
 
-        return console.import_api
-    if extension.endswith(".md"):
-        from pyKomorebi.factory import markdown
 
-        return markdown.import_api
+@lru_cache(maxsize=8)
+def _get_import_api(extension: str):
+    for suffix, module_name in _FACTORY_MODULES:
+        if not extension.endswith(suffix):
+            continue
+        return import_module(module_name).import_api
     raise ValueError(f"Unsupported extension '{extension}' for factory")
+
+
+def get(extension: str):
+    if not extension.startswith("."):
+        raise ValueError(f"Extension '{extension}' must start with a period")
+    return _get_import_api(extension)
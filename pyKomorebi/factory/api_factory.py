@@ -31,6 +31,10 @@ CONSTANTS_PATTERN = re.compile(
     re.DOTALL,
 )
 
+# the patterns above without the leading '.*', matched from the last marker backwards
+DEFAULT_TAIL_PATTERN = re.compile(r"\[default:\s*(?P<default>\w*)\]")
+CONSTANTS_TAIL_PATTERN = re.compile(r"\[possible\s*values:\s*(?P<values>.*)\].*", re.DOTALL)
+
 CLEANUP_PATTERN = [
     re.compile(
         r"(\s*\(without.*?\))",
@@ -50,74 +54,100 @@ def find_line(lines: list[str], search: str, lower_case: bool = False) -> tuple[
     return -1, None
 
 
-def _create_usage(lines: list[str]) -> str | None:
-    idx, line = find_line(lines, USAGE_LINE)
-    if idx < 0 or line is None:
-        return None
-    return line.replace(USAGE_LINE, "").strip()
+SECTION_LINES = (USAGE_LINE, ARGUMENT_LINE, OPTION_LINE)
 
 
-def _create_function_doc(lines: list[str]) -> list[str]:
-    idx, line = find_line(lines, ARGUMENT_LINE)
-    if idx < 0 or line is None:
-        idx, line = find_line(lines, OPTION_LINE)
-    if idx > 0:
-        lines = lines[:idx]
-    idx, line = find_line(lines, USAGE_LINE)
-    if idx > 0 and line is not None:
-        lines.pop(idx)
-    return lines
+def _scan_sections(lines: list[str]) -> dict[str, list[int]]:
+    sections = {section: [] for section in SECTION_LINES}
+    for idx, line in enumerate(lines):
+        # every section header ends with a colon
+        if line is None or ":" not in line:
+            continue
+        for section in SECTION_LINES:
+            if section in line:
+                sections[section].append(idx)
+    return sections
 
 
-def _get_lines(doc_lines: list[str], current: str, other: str) -> list[str]:
-    idx, line = find_line(doc_lines, current)
-    if idx < 0 or line is None:
-        return []
-    lines = doc_lines[idx:]
-    arg_idx, _ = find_line(lines, other)
-    if arg_idx > 0:
-        lines = lines[:arg_idx]
-    return lines
-
-
-def _match_pattern(line: str, patterns: list[re.Pattern]) -> re.Match | None:
-    for pattern in patterns:
-        matched = pattern.match(line)
-        if matched is None:
-            continue
-        return matched
-    return None
+def _section_index(sections: dict[str, list[int]], section: str, start: int = 0) -> int:
+    for idx in sections[section]:
+        if idx >= start:
+            return idx
+    return -1
 
 
-def _match_any_value(matched: re.Match | None, *group_name: str) -> bool:
-    if matched is None:
-        return False
-    for name, value in matched.groupdict().items():
-        if len(group_name) > 0 and name not in group_name:
-            continue
-        if value is None or len(value.strip()) == 0:
-            continue
-        return True
-    return False
+def _remove_section_line(sections: dict[str, list[int]], line_idx: int) -> None:
+    for section, indexes in sections.items():
+        sections[section] = [idx - 1 if idx > line_idx else idx for idx in indexes if idx != line_idx]
 
 
-def _get_indexes(lines: list[str], regexes: list[re.Pattern], *group: str) -> list[int]:
+def _create_usage(lines: list[str], sections: dict[str, list[int]]) -> str | None:
+    idx = _section_index(sections, USAGE_LINE)
+    if idx < 0:
+        return None
+    return lines[idx].replace(USAGE_LINE, "").strip()
+
+
+def _create_function_doc(lines: list[str], sections: dict[str, list[int]]) -> list[str]:
+    idx = _section_index(sections, ARGUMENT_LINE)
+    if idx < 0:
+        idx = _section_index(sections, OPTION_LINE)
+    usage_idx = _section_index(sections, USAGE_LINE)
+    if idx <= 0:
+        if 0 < usage_idx < len(lines):
+            lines.pop(usage_idx)
+            _remove_section_line(sections, usage_idx)
+        return lines
+    if usage_idx == 0:
+        usage_idx = -1
+    return [line for line_idx, line in enumerate(itertools.islice(lines, idx)) if line_idx != usage_idx]
+
+
+def _section_bounds(
+    doc_lines: list[str], sections: dict[str, list[int]], current: str, other: str
+) -> tuple[int, int]:
+    idx = _section_index(sections, current)
+    if idx < 0:
+        return 0, 0
+    other_idx = _section_index(sections, other, start=idx)
+    if other_idx > idx:
+        return idx, other_idx
+    return idx, len(doc_lines)
+
+
+# a header line starts with an option name or an argument name, the lines never contain a newline
+OPTION_HEADER_PATTERN = re.compile(r"^[^\S\n]*-\w|^(?:[^\S\n]|,)*--[\w-]", re.MULTILINE)
+ARGS_HEADER_PATTERN = re.compile(r"^[^\S\n]*(?:<[a-zA-Z-_]+>|\[[A-Z-_]+\])", re.MULTILINE)
+
+
+def _get_indexes(lines: list[str], start: int, end: int, header: re.Pattern) -> list[int]:
+    block = "\n".join(lines[start:end])
     indexes = []
-    for idx, line in enumerate(lines):
-        match = _match_pattern(line, regexes)
-        if not _match_any_value(match, *group):
-            continue
+    idx, position = start, 0
+    for matched in header.finditer(block):
+        idx += block.count("\n", position, matched.start())
+        position = matched.start()
         indexes.append(idx)
-    indexes.append(len(lines))
+    indexes.append(end)
     return indexes
 
 
+def _match_last(pattern: re.Pattern, doc_string: str, marker: str) -> re.Match | None:
+    position = doc_string.rfind(marker)
+    while position >= 0:
+        matched = pattern.match(doc_string, position)
+        if matched is not None:
+            return matched
+        position = doc_string.rfind(marker, 0, position)
+    return None
+
+
 def _get_default_value(doc_string: str) -> tuple[str, str | None]:
-    matched = DEFAULT_PATTERN.match(doc_string)
+    matched = _match_last(DEFAULT_TAIL_PATTERN, doc_string, "[default:")
     if matched is None:
         return doc_string, None
     default = matched.group("default")
-    doc_string = doc_string.replace(matched.group("complete"), "").strip()
+    doc_string = doc_string.replace(matched.group(), "").strip()
     return doc_string, default
 
 
@@ -125,14 +155,15 @@ ENUM_PATTERN = re.compile(r"(?P<name>\s*-\s?[-\w\s]*:)")
 
 
 def split_constant_string(text: str, strip_char: str = " ") -> tuple[str, list[str]]:
-    if ENUM_PATTERN.match(text) is None:
-        return utils.strip_value(text, strip_chars=strip_char), []
-    values = ENUM_PATTERN.split(text, maxsplit=1)
-    values = utils.strip_and_clean_blank(*values, strip_chars=strip_char)
-    if len(values) == 0:
+    matched = ENUM_PATTERN.match(text)
+    if matched is None:
         return utils.strip_value(text, strip_chars=strip_char), []
-    name = values.pop(0).removeprefix("-").removesuffix(":").strip()
-    return name, utils.strip_and_clean_blank(*values, strip_chars=strip_char)
+    name = matched.group("name").strip(strip_char)
+    name = name.removeprefix("-").removesuffix(":").strip()
+    description = text[matched.end() :].strip(strip_char)
+    if len(description) == 0:
+        return name, []
+    return name, [description]
 
 
 def constant_from_lines(lines: list[str]) -> list[CommandConstant]:
@@ -144,58 +175,49 @@ def constant_from_lines(lines: list[str]) -> list[CommandConstant]:
 
 
 def _get_constants_regex(doc_string: str) -> tuple[str, list[CommandConstant]]:
-    matched = CONSTANTS_PATTERN.match(doc_string)
+    matched = _match_last(CONSTANTS_TAIL_PATTERN, doc_string, "[possible")
     if matched is None:
         return doc_string, []
-    complete = matched.group("complete")
-    doc_string = doc_string.replace(complete, "").strip()
+    doc_string = doc_string.replace(matched.group(), "").strip()
     matched_values = matched.group("values").split(",")
     matched_values = utils.strip_lines(*matched_values, strip_chars=" ")
     return doc_string, constant_from_lines(matched_values)
 
 
 def _get_constants_indexes(lines: list[str]) -> list[int]:
-    indexes = []
-    for idx, line in enumerate(lines):
-        if not line.strip().startswith("-"):
-            continue
-        indexes.append(idx)
+    indexes = [idx for idx, line in enumerate(lines) if line.lstrip().startswith("-")]
     indexes.append(len(lines))
     return indexes
 
 
-def _get_constants_startswith(doc_string: str) -> tuple[str, list[CommandConstant]]:
-    doc_lines = utils.strip_and_clean_blank(*doc_string.splitlines(keepends=False), strip_chars=" ")
+def _get_constants_startswith(doc_lines: list[str]) -> tuple[list[str], list[CommandConstant]]:
     idx, line = find_line(doc_lines, search="possible values:", lower_case=True)
     if idx < 0 or line is None:
-        return doc_string, []
-    doc_string = "\n".join(doc_lines[:idx])
+        return doc_lines, []
     values = []
-    doc_lines = doc_lines[idx:]
-    indexes = _get_constants_indexes(doc_lines)
+    constant_lines = doc_lines[idx:]
+    indexes = _get_constants_indexes(constant_lines)
     for index, next in itertools.pairwise(indexes):
-        const_line = doc_lines[index:next]
+        const_line = constant_lines[index:next]
         values.append(" ".join(const_line))
     values = utils.strip_lines(*values)
-    return doc_string, constant_from_lines(values)
-
-
-def _get_constants(doc_string: str) -> tuple[str, list[CommandConstant]]:
-    doc_string, values = _get_constants_regex(doc_string)
-    if len(values) == 0:
-        doc_string, values = _get_constants_startswith(doc_string)
-    return doc_string, values
+    return doc_lines[:idx], constant_from_lines(values)
 
 
 def _docs_default_and_constants(
     doc_lines: list[str], strip_char: str
 ) -> tuple[list[str], str | None, list[CommandConstant]]:
     doc_string = "\n".join(utils.clean_blank(*doc_lines, strip_chars=None))
-    doc_string, default = _get_default_value(doc_string)
-    doc_string, constants = _get_constants(doc_string)
+    default, constants = None, []
+    # both bracketed markers start with '[', most descriptions have neither
+    if "[" in doc_string:
+        doc_string, default = _get_default_value(doc_string)
+        doc_string, constants = _get_constants_regex(doc_string)
     lines = utils.strip_and_clean_blank(
         *doc_string.splitlines(keepends=False), strip_chars=strip_char
     )
+    if len(constants) == 0:
+        lines, constants = _get_constants_startswith(lines)
     return lines, default, constants
 
 
@@ -203,32 +225,30 @@ def _get_option_short_and_name(line: str) -> tuple[str | None, str | None, str |
     option = OPTION_PATTERN.match(line)
     if option is None:
         raise Exception(f"No Option found in line {line}")
-    return (
-        option.group("short"),
-        option.group("name"),
-        option.group("arg"),
-        option.group("description"),
-    )
+    return option.group("short", "name", "arg", "description")
 
 
-def _create_options(doc_lines: list[str], strip_char: str) -> list[CommandOption]:
-    option_lines = _get_lines(doc_lines, current=OPTION_LINE, other=ARGUMENT_LINE)
-    option_indexes = _get_indexes(option_lines, [OPTION_PATTERN], "short", "name")
+def _create_options(
+    doc_lines: list[str], sections: dict[str, list[int]], strip_char: str
+) -> list[CommandOption]:
+    start, end = _section_bounds(doc_lines, sections, current=OPTION_LINE, other=ARGUMENT_LINE)
+    option_indexes = _get_indexes(doc_lines, start, end, OPTION_HEADER_PATTERN)
     options = []
-    for start_idx, next_idx in itertools.pairwise(option_indexes):
-        short, long, arg_value, desc = _get_option_short_and_name(option_lines[start_idx])
-        doc_lines = option_lines[start_idx + 1 : next_idx]
+    for idx in range(len(option_indexes) - 1):
+        start_idx, next_idx = option_indexes[idx], option_indexes[idx + 1]
+        short, long, arg_value, desc = _get_option_short_and_name(doc_lines[start_idx])
+        option_lines = doc_lines[start_idx + 1 : next_idx]
         if utils.is_not_blank(desc):
-            doc_lines = [desc] + doc_lines
-        doc_lines, default, constants = _docs_default_and_constants(
-            doc_lines, strip_char=strip_char
+            option_lines.insert(0, desc)
+        option_lines, default, constants = _docs_default_and_constants(
+            option_lines, strip_char=strip_char
         )
         options.append(
             CommandOption(
                 short=utils.strip_value(short, strip_chars=strip_char),
                 long=utils.strip_value(long, strip_chars=strip_char),
                 value=utils.strip_value(arg_value, strip_chars=strip_char),
-                description=utils.strip_and_clean_blank(*doc_lines, strip_chars=strip_char),
+                description=option_lines,
                 default=utils.strip_value(default, strip_chars=strip_char),
                 constants=constants,
             )
@@ -250,22 +270,25 @@ def _get_argument_name(line: str) -> tuple[str, bool, str | None]:
     return argument.group("name"), optional, argument.group("rest")
 
 
-def _create_arguments(doc_lines: list[str], strip_char: str) -> list[CommandArgument]:
-    args_lines = _get_lines(doc_lines, current=ARGUMENT_LINE, other=OPTION_LINE)
-    args_indexes = _get_indexes(args_lines, [ARGS_PATTERN, ARGS_OPT_PATTERN], "name")
+def _create_arguments(
+    doc_lines: list[str], sections: dict[str, list[int]], strip_char: str
+) -> list[CommandArgument]:
+    start, end = _section_bounds(doc_lines, sections, current=ARGUMENT_LINE, other=OPTION_LINE)
+    args_indexes = _get_indexes(doc_lines, start, end, ARGS_HEADER_PATTERN)
     args = []
-    for start_idx, next_idx in itertools.pairwise(args_indexes):
-        name, optional, rest = _get_argument_name(args_lines[start_idx])
-        doc_lines = args_lines[start_idx + 1 : next_idx]
+    for idx in range(len(args_indexes) - 1):
+        start_idx, next_idx = args_indexes[idx], args_indexes[idx + 1]
+        name, optional, rest = _get_argument_name(doc_lines[start_idx])
+        args_lines = doc_lines[start_idx + 1 : next_idx]
         if utils.is_not_blank(rest):
-            doc_lines = [rest] + doc_lines
-        doc_lines, default, constants = _docs_default_and_constants(
-            doc_lines, strip_char=strip_char
+            args_lines.insert(0, rest)
+        args_lines, default, constants = _docs_default_and_constants(
+            args_lines, strip_char=strip_char
         )
         args.append(
             CommandArgument(
                 argument=utils.strip_value(name, strip_chars=strip_char),
-                description=utils.strip_and_clean_blank(*doc_lines, strip_chars=strip_char),
+                description=args_lines,
                 default=utils.strip_value(default, strip_chars=strip_char),
                 constants=constants,
                 optional=optional,
@@ -277,10 +300,11 @@ def _create_arguments(doc_lines: list[str], strip_char: str) -> list[CommandArgu
 def create_api_command(command_name: str, lines: list[str]) -> ApiCommand:
     api_name = command_name
     lines = utils.clean_pattern_in(lines, CLEANUP_PATTERN)
-    doc_string = _create_function_doc(lines)
-    usage = _create_usage(lines)
-    options = _create_options(lines, strip_char=" ")
-    arguments = _create_arguments(lines, strip_char=" ")
+    sections = _scan_sections(lines)
+    doc_string = _create_function_doc(lines, sections)
+    usage = _create_usage(lines, sections)
+    options = _create_options(lines, sections, strip_char=" ")
+    arguments = _create_arguments(lines, sections, strip_char=" ")
     return ApiCommand(
         name=api_name,
         description=doc_string,
@@ -1,4 +1,5 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import CalledProcessError
 from typing import Iterable, TypeGuard
 
@@ -21,6 +22,9 @@ def create(command: str) -> ApiCommand | None:
     return api_factory.create_api_command(command, lines)
 
 
+NO_COMMAND_PATTERN = re.compile(r"--help|-h|help|Commands|Options|-V")
+
+
 def _is_command(match: re.Match[str] | None) -> TypeGuard[re.Match[str]]:
     if match is None:
         return False
@@ -28,7 +32,7 @@ def _is_command(match: re.Match[str] | None) -> TypeGuard[re.Match[str]]:
     if len(prefix) == 0 or len(prefix) > 5:
         return False
     name = match.group("name").strip()
-    return not any(hlp in name for hlp in ["--help", "-h", "help", "Commands", "Options", "-V"])
+    return NO_COMMAND_PATTERN.search(name) is None
 
 
 def _get_command_names() -> Iterable[str]:
@@ -40,6 +44,10 @@ def _get_command_names() -> Iterable[str]:
         yield match.group("name")
 
 
+# each worker runs one komorebic help process at a time
+HELP_PROCESS_WORKERS = 4
+
+
 def import_api(_: Options) -> Iterable[ApiCommand | None]:
-    for cmd_name in _get_command_names():
-        yield create(cmd_name)
+    with ThreadPoolExecutor(max_workers=HELP_PROCESS_WORKERS) as executor:
+        yield from executor.map(create, _get_command_names())
@@ -1,3 +1,6 @@
+import os
+import re
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable
 
@@ -6,27 +9,12 @@ from pyKomorebi.model import ApiCommand
 from pyKomorebi.factory import api_factory
 
 
-CLEANUP_LINES = ["```"]
+CLEANUP_LINES = frozenset(["```"])
 
 
 def read_markdown(path: Path) -> list[str]:
     with open(path) as md:
-        return md.readlines()
-
-
-def _clean_doc_lines(lines: list[str]) -> list[str]:
-    doc_lines = []
-    for line in lines:
-        if line.strip() in CLEANUP_LINES:
-            continue
-        doc_lines.append(line)
-    return doc_lines
-
-
-def _read_docs(path: Path) -> list[str]:
-    lines = read_markdown(path)
-    lines = _clean_doc_lines(lines)
-    return lines
+        return [line for line in md if line.strip() not in CLEANUP_LINES]
 
 
 def _split_usage_line(line: str, cli_name: str | None = None) -> dict:
@@ -53,31 +41,33 @@ def _get_cmd_name(path: Path, doc_lines: list[str]) -> str:
 
 
 def create(path: Path) -> ApiCommand:
-    lines = _read_docs(path)
+    lines = read_markdown(path)
     api_name = _get_cmd_name(path, lines)
     return api_factory.create_api_command(api_name, lines)
 
 
-def _is_excluded(path: Path, exclude_names: list[str]) -> bool:
-    file_name = path.name.lower()
-    return any(exclude in file_name for exclude in exclude_names)
+def _exclude_pattern(exclude_names: list[str]) -> re.Pattern | None:
+    if len(exclude_names) == 0:
+        return None
+    return re.compile("|".join([re.escape(exclude.lower()) for exclude in exclude_names]))
 
 
-def _is_import_file(path: Path, exclude_names: list[str]) -> bool:
-    if path.is_dir():
-        return False
-    return not _is_excluded(path, exclude_names)
+def _scan_import_files(directory: str | Path, extension: str, exclude: re.Pattern | None) -> Iterable[Path]:
+    for dir_path, _, file_names in os.walk(directory, followlinks=False):
+        for file_name in file_names:
+            if not file_name.endswith(extension):
+                continue
+            if exclude is not None and exclude.search(file_name.lower()) is not None:
+                continue
+            yield Path(dir_path, file_name)
 
 
 def _get_import_files(args: Options) -> list[Path]:
-    exclude = [exclude.lower() for exclude in args["exclude_names"]]
-    import_path = args["import_path"]
-    file_paths = import_path.rglob(f"*{args['extension']}")
-    file_paths = [path for path in file_paths if _is_import_file(path, exclude)]
-    return sorted(file_paths, key=lambda p: p.name)
+    exclude = _exclude_pattern(args["exclude_names"])
+    file_paths = _scan_import_files(args["import_path"], args["extension"], exclude)
+    return sorted(file_paths, key=attrgetter("name"))
 
 
 def import_api(args: Options) -> Iterable[ApiCommand | None]:
     for doc_path in _get_import_files(args):
-        command = create(doc_path)
-        yield command
+        yield create(doc_path)
@@ -1,3 +1,6 @@
+import os
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable, TypedDict, Unpack
 
@@ -14,13 +17,27 @@ class Options(TypedDict):
     translated: creator.TranslationManager
 
 
+WRITE_CHUNK_LINES = 1024
+
+
 def _generate_code(commands: Iterable[ApiCommand | None], **kwargs: Unpack[Options]) -> None:
     code = creator.get(**kwargs)
     commands = [cmd for cmd in commands if cmd is not None]
-    lines = code.generate(sorted(commands, key=lambda x: x.name))
-    with open(kwargs["export_path"], "w") as export_file:
-        content = "\n".join(lines)
-        export_file.write(content)
+    commands.sort(key=attrgetter("name"))
+    lines = iter(code.generate(commands))
+    # the lines are written to a temporary file, the previous export stays until rendering succeeded
+    export_path = Path(kwargs["export_path"])
+    temp_path = export_path.with_name(f"{export_path.name}.tmp")
+    try:
+        with open(temp_path, "w", buffering=1 << 20) as export_file:
+            export_file.write(next(lines, ""))
+            while chunk := list(islice(lines, WRITE_CHUNK_LINES)):
+                export_file.write("\n")
+                export_file.write("\n".join(chunk))
+        os.replace(temp_path, export_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
 
 def generate_code(**kwargs: Unpack[Options]) -> None:
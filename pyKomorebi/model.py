@@ -1,22 +1,10 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import TypeGuard
 from dataclasses import dataclass, field
 
 from pyKomorebi import utils
 
 
-def _is_value(value: str | None) -> TypeGuard[str]:
-    if value is None:
-        return False
-    return len(value.strip()) > 0
-
-
-def _value(value: str | None) -> str | None:
-    if not _is_value(value):
-        return None
-    return value.strip()
-
-
 @dataclass
 class CommandBase(ABC):
     description: list[str] = field(compare=False, repr=False)
@@ -24,7 +12,7 @@ class CommandBase(ABC):
 
     def __post_init__(self):
         self.description = utils.strip_and_clean_blank(*self.description, strip_chars=" ")
-        self.name = self._get_name()
+        self.name = sys.intern(self._get_name())
 
     @abstractmethod
     def _get_name(self) -> str:
@@ -39,6 +27,8 @@ class CommandConstant(CommandBase):
     constant: str = field(compare=True, repr=True)
 
     def __post_init__(self):
+        # the same few values repeat across many commands
+        self.constant = sys.intern(self.constant)
         super().__post_init__()
 
     def _get_name(self) -> str:
@@ -61,7 +51,7 @@ class CommandArgs(CommandBase):
 
     def __post_init__(self):
         super().__post_init__()
-        self.default = _value(self.default)
+        self.default = None if self.default is None else self.default.strip() or None
         self.constants = [value for value in self.constants if value.name is not None]
 
     def has_constants(self) -> bool:
@@ -83,9 +73,9 @@ class CommandOption(CommandArgs):
 
     def __post_init__(self):
         super().__post_init__()
-        self.short = _value(self.short)
-        self.long = _value(self.long)
-        self.value = _value(self.value)
+        self.short = None if self.short is None else sys.intern(self.short.strip()) or None
+        self.long = None if self.long is None else sys.intern(self.long.strip()) or None
+        self.value = None if self.value is None else sys.intern(self.value.strip()) or None
 
     def has_value(self) -> bool:
         return self.value is not None
@@ -130,6 +120,7 @@ class CommandArgument(CommandArgs):
     optional: bool
 
     def __post_init__(self):
+        self.argument = sys.intern(self.argument)
         super().__post_init__()
 
     def _get_name(self) -> str:
@@ -149,8 +140,10 @@ class ApiCommand:
 
     def __post_init__(self):
         self.description = utils.strip_and_clean_blank(*self.description)
-        self.usage = _value(self.usage)
+        self.usage = None if self.usage is None else self.usage.strip() or None
 
     def remove_help_option(self):
-        options = [opt for opt in self.options if not opt.is_help()]
-        self.options = options
+        # the creators call this for every command, usually after it is already gone
+        if not any(opt.is_help() for opt in self.options):
+            return
+        self.options = [opt for opt in self.options if not opt.is_help()]
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Any, TypeGuard
 
 
@@ -17,6 +18,8 @@ def strip_lines(*line: str | None, strip_chars: str | None = None) -> list[str]:
 def is_not_blank(line: Any, strip_chars: str | None = None) -> TypeGuard[str]:
     if line is None:
         return False
+    if type(line) is str and strip_chars is None:
+        return len(line) > 0
     if not isinstance(line, str):
         line = str(line)
     if strip_chars is not None:
@@ -25,8 +28,9 @@ def is_not_blank(line: Any, strip_chars: str | None = None) -> TypeGuard[str]:
 
 
 def strip_and_clean_blank(*text: str | None, strip_chars: str | None = None) -> list[str]:
-    values = strip_lines(*text, strip_chars=strip_chars)
-    return [val for val in values if is_not_blank(val, strip_chars=strip_chars)]
+    if strip_chars is None:
+        return strip_lines(*text)
+    return [value for val in text if len(value := strip_value(val, strip_chars)) > 0]
 
 
 def clean_blank(*text: str | None, strip_chars: str | None = None) -> list[str]:
@@ -44,20 +48,18 @@ def quote(value: str, quote_str: str = "\"") -> str:
 
 
 def replace_double_quotes(lines: list[str]) -> list[str]:
-    changed = []
-    for line in lines:
-        if '"' in line and not line.startswith('"') and not line.endswith('"'):
-            line = line.replace('"', "'")
-        changed.append(line)
-    return changed
+    return [
+        line.replace('"', "'")
+        if '"' in line and not line.startswith('"') and not line.endswith('"')
+        else line
+        for line in lines
+    ]
 
 
 def _clean_pattern_in(line: str, patterns: list[re.Pattern]) -> str:
     for pattern in patterns:
-        matched = pattern.findall(line)
-        if matched is None:
-            continue
-        for match_string in matched:
+        # replacing every occurrence of a match in turn is not the same as a single sub
+        for match_string in pattern.findall(line):
             replace = ""
             if match_string.startswith(" ") or match_string.endswith(" "):
                 replace = " "
@@ -76,6 +78,8 @@ def as_string(*values: str, separator: str) -> str:
         return ""
     if len(values) == 1:
         return values[0]
+    if all(values):
+        return separator.join(values)
     return separator.join([value for value in values if len(value) > 0])
 
 
@@ -85,26 +89,34 @@ def lines_as_str(*values: str) -> str:
     return as_string(*values, separator="\n")
 
 
-LAST_SPACE_REGEX = re.compile(r'\s+(?=(?:[^"\']*["\'][^"\']*["\'])*[^"\']*$)')
+QUOTE_OR_SPACE_REGEX = re.compile(r"[\"'\s]")
 
 
 def last_space_index(text: str) -> int:
-    # Regulärer Ausdruck, um das letzte Leerzeichen außerhalb von Anführungszeichen zu finden
-    matched = re.search(LAST_SPACE_REGEX, text[::-1])
-    if matched is not None:
-        split_index = len(text) - matched.start()
-        return split_index
-    return -1
+    # index after the last whitespace outside of quotes, found in one forward pass
+    split_index, quotes = -1, 0
+    for matched in QUOTE_OR_SPACE_REGEX.finditer(text):
+        if matched.group() in "\"'":
+            quotes += 1
+        elif quotes % 2 == 0:
+            split_index = matched.end()
+    return split_index
 
 
 SENTENCE_SPLIT = re.compile(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s")
 
 
+# has_sentence and get_sentences are usually called one after the other with the same text
+@lru_cache(maxsize=1024)
+def _split_sentences(line: str) -> tuple[str, ...]:
+    return tuple(SENTENCE_SPLIT.split(line))
+
+
 def has_sentence(*text: str) -> bool:
     line = as_string(*text, separator=" ")
-    return SENTENCE_SPLIT.search(line) is not None
+    return len(_split_sentences(line)) > 1
 
 
 def get_sentences(*text: str) -> list[str]:
     line = as_string(*text, separator=" ")
-    return SENTENCE_SPLIT.split(line)
+    return list(_split_sentences(line))
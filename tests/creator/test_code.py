@@ -0,0 +1,54 @@
+from pyKomorebi.creator.lisp.code import LispCodeFormatter
+
+
+def _formatter(max_length: int) -> LispCodeFormatter:
+    return LispCodeFormatter(module_name="komorebi", max_length=max_length)
+
+
+def test_concat_one_with_prefix():
+    lines = _formatter(20).concat_values("value", separator=" ", prefix=4)
+    assert lines == ["    value"]
+
+
+def test_concat_one_fills_column():
+    lines = _formatter(20).concat_values("name", separator=" ", columns=8)
+    assert lines == ["name    "]
+
+
+def test_concat_values_fits_on_one_line():
+    lines = _formatter(40).concat_values("one", "two", "", "three", separator=" ")
+    assert lines == ["one two three"]
+
+
+def test_concat_values_wraps_with_separator():
+    lines = _formatter(20).concat_values("alpha", "beta", "gamma", "delta", separator=", ")
+    assert lines == ["alpha, beta, gamma,", "delta"]
+
+
+def test_concat_values_wraps_into_column():
+    lines = _formatter(20).concat_values("name", "first value", "second value", separator=" ", columns=6)
+    assert lines == ["name   first value", "       second value"]
+
+
+def test_concat_values_prefix_wider_than_column():
+    lines = _formatter(20).concat_values(
+        "name", "first value", "second value", separator=" ", columns=6, prefix=10
+    )
+    assert lines == ["          name", "          first value", "          second value"]
+
+
+def test_concat_values_wraps_long_value_at_space():
+    lines = _formatter(20).concat_values("start", "a value that is much too long", separator=" ")
+    assert lines == ["start a value that", "is much too long"]
+
+
+def test_concat_values_splits_long_code_value():
+    lines = _formatter(30).concat_values(
+        "(execute", '"cmd"', "(args-get first second third fourth)", separator=" ", is_code=True
+    )
+    assert lines == ['(execute "cmd" (args-get first', "second third fourth)"]
+
+
+def test_concat_values_keeps_quoted_words_in_code():
+    lines = _formatter(30).concat_values("(list", '"a b c d e f g h i j k l m n o p"', separator=" ", is_code=True)
+    assert lines == ['(list "a b c d e f g h i j k l', 'm n o p"']
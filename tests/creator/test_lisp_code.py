@@ -0,0 +1,26 @@
+from pyKomorebi.creator import TranslationManager
+from pyKomorebi.creator.lisp.code import LispCodeFormatter, LispPackageHandler, OptionCreator
+from pyKomorebi.model import CommandOption
+
+
+def _option(long: str) -> CommandOption:
+    return CommandOption(short=None, long=long, value=None, description=[], default=None, constants=[])
+
+
+def _option_creator(*longs: str) -> OptionCreator:
+    formatter = LispCodeFormatter(module_name="komorebi", max_length=80)
+    translation = TranslationManager(option_map={}, argument_map={}, variable_map={})
+    handler = LispPackageHandler(formatter, translation)
+    return OptionCreator([_option(long) for long in longs], handler)
+
+
+def test_doc_names_are_replaced_in_option_order():
+    creator = _option_creator("--focus", "--focus-follows-mouse")
+    line = creator.apply_doc_names_to("Enable focus-follows-mouse or focus")
+    assert line == "Enable FOCUS-follows-mouse or FOCUS"
+
+
+def test_doc_names_longer_name_first():
+    creator = _option_creator("--focus-follows-mouse", "--focus")
+    line = creator.apply_doc_names_to("Enable focus-follows-mouse or focus")
+    assert line == "Enable FOCUS-FOLLOWS-MOUSE or FOCUS"
@@ -0,0 +1,278 @@
+from pyKomorebi.factory import api_factory
+
+
+MULTI_SECTION = """Set the ease function for the animation
+
+Usage: komorebic.exe animation-style [OPTIONS] [STYLE]
+
+Arguments:
+  [STYLE]
+          Desired ease function for animation
+
+          [default: linear]
+          [possible values: linear, ease-in-sine, ease-out-sine]
+
+Options:
+  -a, --animation-type <ANIMATION_TYPE>
+          Animation type to apply the style to. If not specified, sets global style
+
+          Possible values:
+          - movement:    Animation for window movement
+          - transparency: Animation for transparency change (without fading)
+
+  -h, --help
+          Print help (see a summary with '-h')
+"""
+
+OPTIONS_BEFORE_ARGUMENTS = """Focus the window in the specified direction
+
+Usage: komorebic.exe focus [OPTIONS] <OPERATION_DIRECTION>
+
+Options:
+      --await
+          Wait for the command
+
+  -h, --help
+          Print help
+
+Arguments:
+  <OPERATION_DIRECTION>
+          [possible values: left, right, up, down]
+"""
+
+DEFAULT_AND_CONSTANTS = """Set the border style
+
+Usage: komorebic.exe border-style <STYLE> [WIDTH]
+
+Arguments:
+  <STYLE>
+          Desired border style [default: system] [possible values: system, rounded, square]
+
+  [WIDTH]
+          Width of the border [default: 8]
+"""
+
+NO_SECTIONS = """Start komorebi.exe as a background process
+"""
+
+USAGE_ONLY = """Stop komorebi.exe
+
+Usage: komorebic.exe stop
+"""
+
+NO_ARGUMENTS = """Toggle the paused state
+
+Usage: komorebic.exe toggle-pause [OPTIONS]
+
+Options:
+  -h, --help
+          Print help
+"""
+
+VARIADIC = """Ensure named workspaces
+
+Usage: komorebic.exe ensure-named-workspaces <MONITOR_INDEX> [NAMES]...
+
+Arguments:
+  <MONITOR_INDEX>
+          Monitor index (zero-indexed)
+
+  [NAMES]...
+          Names of desired workspaces
+"""
+
+
+def _command(name: str, help_text: str):
+    return api_factory.create_api_command(name, help_text.splitlines(keepends=True))
+
+
+def _constant_names(arg) -> list[str]:
+    return [constant.constant for constant in arg.constants]
+
+
+def test_multi_section_help():
+    command = _command("animation-style", MULTI_SECTION)
+    assert command.description == ["Set the ease function for the animation"]
+    assert command.usage == "komorebic.exe animation-style [OPTIONS] [STYLE]"
+    assert [arg.argument for arg in command.arguments] == ["[STYLE]"]
+    style = command.arguments[0]
+    assert style.optional
+    assert style.description == ["Desired ease function for animation"]
+    assert style.default == "linear"
+    assert _constant_names(style) == ["linear", "ease-in-sine", "ease-out-sine"]
+    assert [(opt.short, opt.long, opt.value) for opt in command.options] == [
+        ("-a", "--animation-type", "<ANIMATION_TYPE>"),
+        ("-h", "--help", None),
+    ]
+    animation_type = command.options[0]
+    assert animation_type.description == [
+        "Animation type to apply the style to. If not specified, sets global style"
+    ]
+    assert [(cst.constant, cst.description) for cst in animation_type.constants] == [
+        ("movement", ["Animation for window movement"]),
+        ("transparency", ["Animation for transparency change"]),
+    ]
+
+
+def test_options_before_arguments():
+    command = _command("focus", OPTIONS_BEFORE_ARGUMENTS)
+    assert [(opt.short, opt.long) for opt in command.options] == [(None, "--await"), ("-h", "--help")]
+    assert command.options[0].description == ["Wait for the command"]
+    assert [arg.argument for arg in command.arguments] == ["<OPERATION_DIRECTION>"]
+    direction = command.arguments[0]
+    assert not direction.optional
+    assert direction.description == []
+    assert _constant_names(direction) == ["left", "right", "up", "down"]
+
+
+def test_inline_default_and_constants():
+    command = _command("border-style", DEFAULT_AND_CONSTANTS)
+    style, width = command.arguments
+    assert style.description == ["Desired border style"]
+    assert style.default == "system"
+    assert _constant_names(style) == ["system", "rounded", "square"]
+    assert width.optional
+    assert width.description == ["Width of the border"]
+    assert width.default == "8"
+    assert width.constants == []
+
+
+def test_variadic_argument():
+    command = _command("ensure-named-workspaces", VARIADIC)
+    assert [(arg.argument, arg.optional) for arg in command.arguments] == [
+        ("<MONITOR_INDEX>", False),
+        ("[NAMES]", False),
+    ]
+    assert command.arguments[1].description == ["Names of desired workspaces"]
+
+
+def test_no_sections():
+    command = _command("start", NO_SECTIONS)
+    assert command.description == ["Start komorebi.exe as a background process"]
+    assert command.usage is None
+    assert command.arguments == []
+    assert command.options == []
+
+
+def test_usage_only():
+    command = _command("stop", USAGE_ONLY)
+    assert command.description == ["Stop komorebi.exe"]
+    assert command.arguments == []
+    assert command.options == []
+
+
+def test_options_without_arguments():
+    command = _command("toggle-pause", NO_ARGUMENTS)
+    assert command.description == ["Toggle the paused state"]
+    assert command.arguments == []
+    assert [opt.long for opt in command.options] == ["--help"]
+
+
+def test_last_default_is_used():
+    doc_string, default = api_factory._get_default_value("Value [default: a] or [default: b] end")
+    assert default == "b"
+    assert doc_string == "Value [default: a] or  end"
+
+
+def test_empty_default():
+    doc_string, default = api_factory._get_default_value("Text [default: ]")
+    assert default == ""
+    assert doc_string == "Text"
+
+
+def test_no_default():
+    doc_string, default = api_factory._get_default_value("No default here")
+    assert default is None
+    assert doc_string == "No default here"
+
+
+def test_constants_tail_includes_trailing_text():
+    doc_string, constants = api_factory._get_constants_regex("[default:x]\n[possible values: a, b]\ntrailing")
+    assert doc_string == "[default:x]"
+    assert [constant.constant for constant in constants] == ["a", "b"]
+
+
+def test_last_constants_are_used():
+    doc_string, constants = api_factory._get_constants_regex(
+        "one [possible values: a, b] two [possible values: c, d]"
+    )
+    assert doc_string == "one [possible values: a, b] two"
+    assert [constant.constant for constant in constants] == ["c", "d"]
+
+
+def test_unparsable_default_falls_back_to_earlier_marker():
+    doc_string, default = api_factory._get_default_value("x [default: c] y [default: a b]")
+    assert default == "c"
+    assert doc_string == "x  y [default: a b]"
+
+
+def test_unclosed_default_falls_back_to_earlier_marker():
+    doc_string, default = api_factory._get_default_value("Value [default: a] then [default: not closed")
+    assert default == "a"
+    assert doc_string == "Value  then [default: not closed"
+
+
+def test_duplicate_default_markers_are_all_removed():
+    doc_string, default = api_factory._get_default_value("A [default: x] B [default: x]")
+    assert default == "x"
+    assert doc_string == "A  B"
+
+
+def test_constants_tail_removes_trailing_text():
+    doc_string, constants = api_factory._get_constants_regex("Mode [possible values: a, b] more")
+    assert doc_string == "Mode"
+    assert [constant.constant for constant in constants] == ["a", "b"]
+
+
+def test_unclosed_constants_fall_back_to_earlier_marker():
+    doc_string, constants = api_factory._get_constants_regex(
+        "one [possible values: a, b] two [possible values: broken"
+    )
+    assert doc_string == "one"
+    assert [constant.constant for constant in constants] == ["a", "b"]
+
+
+OPTION_SECTION = [
+    "Usage: komorebic.exe animation-style [OPTIONS] [STYLE]",
+    "",
+    "Options:",
+    "  -a, --animation-type <ANIMATION_TYPE>",
+    "          Animation type to apply the style to. If not specified, sets global style",
+    "",
+    "          Possible values:",
+    "          - movement:    Animation for window movement",
+    "          - transparency: Animation for transparency change",
+    "",
+    "      --await",
+    "          Wait for the command",
+    "",
+    "  -h, --help",
+    "          Print help (see a summary with '-h')",
+]
+
+ARGUMENT_SECTION = [
+    "Arguments:",
+    "  <MONITOR_INDEX>",
+    "          Monitor index (zero-indexed)",
+    "",
+    "  [NAMES]...",
+    "          Names of desired workspaces",
+    "",
+    "Options:",
+    "  -h, --help",
+]
+
+
+def test_option_header_indexes():
+    indexes = api_factory._get_indexes(OPTION_SECTION, 2, len(OPTION_SECTION), api_factory.OPTION_HEADER_PATTERN)
+    assert indexes == [3, 10, 13, 15]
+
+
+def test_argument_header_indexes():
+    indexes = api_factory._get_indexes(ARGUMENT_SECTION, 0, 7, api_factory.ARGS_HEADER_PATTERN)
+    assert indexes == [1, 4, 7]
+
+
+def test_header_indexes_without_headers():
+    indexes = api_factory._get_indexes(OPTION_SECTION, 4, 10, api_factory.OPTION_HEADER_PATTERN)
+    assert indexes == [10]
@@ -0,0 +1,31 @@
+from pyKomorebi import utils
+
+
+def test_last_space_index_plain_text():
+    assert utils.last_space_index("one two three") == 8
+    assert utils.last_space_index("one\ttwo") == 4
+
+
+def test_last_space_index_trailing_space():
+    assert utils.last_space_index("trailing space ") == 15
+
+
+def test_last_space_index_no_space():
+    assert utils.last_space_index("nospace") == -1
+    assert utils.last_space_index("") == -1
+
+
+def test_last_space_index_is_within_the_text():
+    assert utils.last_space_index(" ") == 1
+    assert utils.last_space_index("a  ") == 3
+
+
+def test_last_space_index_skips_quoted_spans():
+    assert utils.last_space_index('set "a b c"') == 4
+    assert utils.last_space_index("set 'a b' c") == 10
+    assert utils.last_space_index('"a b"') == -1
+
+
+def test_last_space_index_odd_quote_count():
+    assert utils.last_space_index('a "b c') == 2
+    assert utils.last_space_index('a" b c') == -1